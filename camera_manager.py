@@ -3,6 +3,8 @@
 """
 
 import cv2
+import threading
+import time
 import urllib.request
 import numpy as np
 import config
@@ -10,9 +12,104 @@ from logger_config import setup_logger
 
 logger = setup_logger(__name__)
 
+
+class CaptureThread:
+    """
+    独立采集线程
+    后台线程持续读取摄像头帧，只保留最新的一帧（单槽交换），
+    主循环处理速度慢于采集速度时直接跳过过期帧，不会在驱动缓冲中积压延迟
+    """
+    
+    RETRY_INTERVAL_MIN = 0.005    # 读取失败后的首次重试间隔（秒）
+    RETRY_INTERVAL_MAX = 1.0      # 连续失败时重试间隔的上限（秒）
+    FAILURE_LOG_INTERVAL = 5.0    # 持续失败时重复记录日志的间隔（秒）
+    
+    def __init__(self, reader):
+        """
+        初始化采集线程
+        Args:
+            reader: 读取一帧的函数，返回 (success, frame)
+        """
+        self._reader = reader
+        self._frame = None
+        self._frame_id = 0        # 最新帧序号
+        self._consumed_id = 0     # 上次被取走的帧序号
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def start(self):
+        """启动采集线程"""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="camera-capture", daemon=True)
+        self._thread.start()
+    
+    def _run(self):
+        """
+        采集循环：读取成功后覆盖最新帧并唤醒等待者
+        读取失败（如设备被拔出）时重试间隔按指数退避，日志只在开始失败、
+        此后每隔 FAILURE_LOG_INTERVAL 秒以及恢复时各记录一次
+        """
+        retry_interval = self.RETRY_INTERVAL_MIN
+        failures = 0
+        last_log_time = 0.0
+        while not self._stop.is_set():
+            error = None
+            try:
+                success, frame = self._reader()
+            except Exception as e:
+                success, frame, error = False, None, e
+            
+            if not success or frame is None:
+                failures += 1
+                now = time.monotonic()
+                if failures == 1 or now - last_log_time >= self.FAILURE_LOG_INTERVAL:
+                    logger.warning("采集线程读取帧失败（已连续 %d 次）: %s", failures, error or "未读取到帧")
+                    last_log_time = now
+                self._stop.wait(retry_interval)
+                retry_interval = min(retry_interval * 2, self.RETRY_INTERVAL_MAX)
+                continue
+            
+            if failures:
+                logger.info("采集线程已恢复读取，此前连续失败 %d 次", failures)
+                failures = 0
+                retry_interval = self.RETRY_INTERVAL_MIN
+            
+            with self._cond:
+                self._frame = frame
+                self._frame_id += 1
+                self._cond.notify()
+    
+    def read_latest(self, timeout: float = 1.0):
+        """
+        获取最新的一帧，没有新帧时等待
+        Args:
+            timeout: 最长等待时间（秒）
+        Returns:
+            (success, frame)，超时返回 (False, None)
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._frame_id != self._consumed_id or self._stop.is_set(), timeout):
+                return False, None
+            if self._frame_id == self._consumed_id:
+                return False, None
+            self._consumed_id = self._frame_id
+            return True, self._frame
+    
+    def stop(self):
+        """停止采集线程并等待其退出"""
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
 class CameraManager:
     """摄像头管理器，支持本地和远程摄像头"""
     
+    MAX_STALE_GRABS = 5  # read_latest 单次最多丢弃的缓冲帧数
+    
     def __init__(self, use_ip_camera=False, ip_camera_url=None):
         """
         初始化摄像头管理器
@@ -27,17 +124,29 @@ class CameraManager:
         
         # IP摄像头相关
         self.stream = None
+        
+        # 独立采集线程
+        self.capture_thread = None
     
     def initialize(self) -> bool:
         """初始化摄像头"""
         try:
             if self.use_ip_camera and self.ip_camera_url:
-                return self._initialize_ip_camera()
+                initialized = self._initialize_ip_camera()
             else:
-                return self._initialize_local_camera()
+                initialized = self._initialize_local_camera()
         except Exception as e:
             logger.error(f"摄像头初始化失败: {e}")
             return False
+        
+        if initialized and getattr(config, 'CAMERA_THREADED_CAPTURE', False):
+            # 采集线程使用不记录日志的读取函数，失败日志由采集线程统一限频记录
+            reader = self._fetch_ip_frame if self.use_ip_camera else self._grab_local_frame
+            self.capture_thread = CaptureThread(reader)
+            self.capture_thread.start()
+            logger.info("独立采集线程已启动")
+        
+        return initialized
     
     def _initialize_local_camera(self) -> bool:
         """初始化本地摄像头"""
@@ -54,6 +163,8 @@ class CameraManager:
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, config.CAMERA_FRAME_WIDTH)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config.CAMERA_FRAME_HEIGHT)
             self.cap.set(cv2.CAP_PROP_FPS, config.CAMERA_FPS)
+            # 驱动缓冲区只保留一帧，减少积压的过期帧（部分后端不支持，忽略失败）
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             
             # 验证设置
             actual_width = self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)
@@ -101,12 +212,49 @@ class CameraManager:
             return False, None
             
         try:
+            if self.capture_thread is not None:
+                return self.capture_thread.read_latest(timeout=1.0)
             if self.use_ip_camera:
                 return self._read_ip_frame()
             else:
                 return self._read_local_frame()
         except Exception as e:
-            logger.error(f"读取摄像头帧失败: {e}")
+            logger.error("读取摄像头帧失败: %s", e)
+            return False, None
+    
+    def read_latest(self):
+        """
+        读取最新的摄像头帧
+        本地摄像头未启用采集线程时，先用 grab() 跳过驱动缓冲中积压的旧帧（不解码），
+        再只对最新的一帧 retrieve() 解码；其余情况等同于 read_frame
+        Returns:
+            (success, frame)
+        """
+        if self.capture_thread is not None or self.use_ip_camera or not self.is_initialized:
+            return self.read_frame()
+        
+        cap = self.cap
+        if cap is None:
+            return False, None
+        
+        try:
+            # grab 立即返回说明缓冲区中还有旧帧，继续跳过；需要等待新帧时说明已取到最新帧。
+            # 第一次 grab 也计时：处理速度跟得上摄像头时它本身就会等待新帧，
+            # 此时直接解码，不再多取一帧（否则每次都会多消耗一帧，处理帧率减半）
+            fast_grab = 0.5 / max(config.CAMERA_FPS, 1)
+            perf_counter = time.perf_counter
+            start = perf_counter()
+            if not cap.grab():
+                return False, None
+            if perf_counter() - start < fast_grab:
+                for _ in range(self.MAX_STALE_GRABS):
+                    start = perf_counter()
+                    if not cap.grab() or perf_counter() - start >= fast_grab:
+                        break
+            
+            return cap.retrieve()
+        except Exception as e:
+            logger.error("读取摄像头帧失败: %s", e)
             return False, None
     
     def _read_local_frame(self):
@@ -115,28 +263,41 @@ class CameraManager:
             return False, None
         return self.cap.read()
     
+    def _grab_local_frame(self):
+        """采集线程使用：grab + retrieve 读取本地摄像头帧"""
+        cap = self.cap
+        if cap is None or not cap.grab():
+            return False, None
+        return cap.retrieve()
+    
+    def _fetch_ip_frame(self):
+        """从IP摄像头获取一帧，出错时直接抛出异常"""
+        img_url = f"{self.ip_camera_url}/shot.jpg"
+        img_resp = urllib.request.urlopen(img_url, timeout=1)
+        img_np = np.array(bytearray(img_resp.read()), dtype=np.uint8)
+        img = cv2.imdecode(img_np, cv2.IMREAD_COLOR)
+        
+        if img is None:
+            return False, None
+        # 调整图像大小以匹配配置
+        img = cv2.resize(img, (config.CAMERA_FRAME_WIDTH, config.CAMERA_FRAME_HEIGHT))
+        return True, img
+    
     def _read_ip_frame(self):
         """读取IP摄像头帧"""
         try:
-            # 从IP摄像头获取图像
-            img_url = f"{self.ip_camera_url}/shot.jpg"
-            img_resp = urllib.request.urlopen(img_url, timeout=1)
-            img_np = np.array(bytearray(img_resp.read()), dtype=np.uint8)
-            img = cv2.imdecode(img_np, cv2.IMREAD_COLOR)
-            
-            if img is not None:
-                # 调整图像大小以匹配配置
-                img = cv2.resize(img, (config.CAMERA_FRAME_WIDTH, config.CAMERA_FRAME_HEIGHT))
-                return True, img
-            else:
-                return False, None
-                
+            return self._fetch_ip_frame()
         except Exception as e:
-            logger.error(f"读取IP摄像头帧失败: {e}")
+            logger.error("读取IP摄像头帧失败: %s", e)
             return False, None
     
     def release(self):
         """释放摄像头资源"""
+        # 先停止采集线程，避免其继续访问即将释放的摄像头
+        if self.capture_thread is not None:
+            self.capture_thread.stop()
+            self.capture_thread = None
+        
         if self.cap is not None:
             logger.info("正在释放摄像头资源")
             self.cap.release()
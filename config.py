@@ -11,6 +11,7 @@ CAMERA_INDEX = 0                # 摄像头索引
 CAMERA_FPS = 60                 # 摄像头帧率设置
 CAMERA_FRAME_WIDTH = 640        # 摄像头帧宽度
 CAMERA_FRAME_HEIGHT = 360       # 摄像头帧高度
+CAMERA_THREADED_CAPTURE = True  # 是否使用独立采集线程（主循环始终处理最新帧，避免驱动缓冲导致的延迟）
 
 # IP摄像头配置 (远程摄像头)
 USE_IP_CAMERA = False            # 是否使用IP摄像头 (True: 使用远程摄像头, False: 使用本地摄像头)
@@ -29,6 +30,10 @@ IP_CAMERA_URL = "http://10.162.94.65:8080"  # IP摄像头URL (例如小米平板
 CONNECTION_TYPE = 'socket'      # 连接类型：'socket' 或 'bluetooth'
 SOCKET_HOST = '127.0.0.1'  # Socket 主机地址
 SOCKET_PORT = 65432             # Socket 端口号
+SOCKET_ASYNC_SEND = False       # 异步发送：消息由后台线程合并发送，不等待服务器响应（消息以换行分隔，服务器需按行解析）
+SOCKET_LENGTH_PREFIX = False    # 长度前缀分帧：每条消息前加 4 字节小端长度后发送，服务器需按长度解析（同步与异步发送均适用；帧头与消息体仅在 POSIX 系统上用一次 sendmsg 发出，Windows 上拼接后 sendall）
+SOCKET_PER_THREAD = False       # 按线程划分连接：每个发送线程使用自己的 TCP 连接，多线程发送时互不争用锁
+SOCKET_LOW_LATENCY = False      # 低延迟模式：Linux 上对连接启用 SO_BUSY_POLL 忙轮询，以额外的 CPU 占用换取更低的响应延迟
 BLUETOOTH_MAC = 'XX:XX:XX:XX:XX:XX'  # 蓝牙MAC地址
 BLUETOOTH_PORT = 4              # 蓝牙RFCOMM端口
 
@@ -40,7 +45,13 @@ HAND_DETECTION_CONFIG = {
     'max_hands': 1,           # 最大检测手数
     'model_complexity': 1,    # 模型复杂度 (0-2)
     'detection_confidence': 0.5,        # 检测置信度
-    'min_tracking_confidence': 0.5      # 最小跟踪置信度
+    'min_tracking_confidence': 0.5,     # 最小跟踪置信度
+    'detection_interval': 1,            # 每隔多少帧运行一次手部检测，中间帧复用上次结果 (1: 每帧检测)
+    'redetect_iou_threshold': 0.7,      # 相邻两次检测的包围盒IoU低于该值（手在快速移动）时恢复逐帧检测
+    'input_scale': 1.0,                 # 送入检测器前的图像缩放比例 (如 0.5 为长宽减半)，关键点坐标自动映射回原图
+    'live_stream': False,               # 使用 MediaPipe LIVE_STREAM 异步检测：不阻塞主循环，但手势结果滞后约一帧
+    'model_path': 'cvzone/hand_landmarker.task',  # HandLandmarker 模型包路径，可指向 INT8 量化模型以加快 CPU 推理
+    'use_opencl': False                 # 检测前的缩放和颜色转换是否通过 cv2.UMat 交给 OpenCL 设备（不支持时自动回退）
 }
 
 # ==============================================================================
@@ -70,8 +81,14 @@ GESTURE_CONFIG = {
         'jitter_tolerance_frames': 3,    # 允许连续多少帧的误判而不重置状态
         'trajectory_smoothing': {
             'enable_smoothing': True,     # 启用轨迹平滑
+            'filter_type': 'one_euro',    # 平滑算法：'one_euro'（自适应）或 'ema'（固定系数）
             'smoothing_window': 5,        # 平滑窗口大小（点数）
-            'smoothing_weight': 0.3,      # 新位置权重（低通滤波器系数）
+            'smoothing_weight': 0.3,      # 新位置权重（仅 'ema' 使用）
+            # One-Euro 滤波器参数
+            'min_cutoff': 1.0,            # 最小截止频率（Hz），越小静止时越平滑
+            'beta': 0.01,                 # 速度系数，越大快速移动时延迟越小
+            'd_cutoff': 1.0,              # 速度估计截止频率（Hz）
+            'frequency': 30.0,            # 默认采样频率（Hz）
         },
         'tracking_config': {
             'enable_tracking': True,        # 启用轨迹追踪
@@ -205,4 +222,7 @@ COLORS = {
     'fps_text': (255, 255, 255),       # 白色 - FPS文本颜色
     'fist_trail': (0, 255, 255),       # 青色 - 握拳轨迹颜色
     'fist_center': (0, 0, 255),        # 红色 - 握拳时掌心颜色
+    'landmark_line': (255, 255, 255),  # 白色 - 手部骨架连线颜色
+    'landmark_point': (0, 0, 255),     # 红色 - 手部关键点颜色
+    'landmark_bbox': (255, 0, 255),    # 品红 - 手部包围盒及左右手标签颜色
 }
@@ -1,8 +1,14 @@
 import socket
+import sys
 import threading
 import time
 import atexit
-from typing import Optional
+import logging
+import queue
+import random
+import struct
+import weakref
+from typing import Dict, List, Optional, Tuple, Union
 from abc import ABC, abstractmethod
 
 # 注意：使用蓝牙功能可能需要安装额外的库
@@ -10,20 +16,74 @@ from abc import ABC, abstractmethod
 # 如果遇到蓝牙相关的导入错误，请参考系统对应的蓝牙库文档
 
 import config
+from logger_config import setup_logger
+
+
+# 收发热路径上的调试日志：经队列交给后台线程写入日志文件，%s 参数仅在 DEBUG 级别启用时才格式化
+# 首次创建客户端时才建立，仅导入本模块（如测试服务器）不会创建日志文件和监听线程
+_logger: Optional[logging.Logger] = None
+_logger_lock = threading.Lock()
+
+
+def _get_logger() -> logging.Logger:
+    """获取客户端日志记录器，首次调用时创建"""
+    global _logger
+    if _logger is None:
+        with _logger_lock:
+            if _logger is None:
+                _logger = setup_logger("socket_client", "DEBUG")
+    return _logger
+
+# 放入发件箱以通知发送线程退出的哨兵
+_STOP_SENDER = None
+
+# 长度前缀分帧的帧头：4 字节小端无符号整数，表示其后 UTF-8 消息体的字节数
+_FRAME_HEADER = struct.Struct('<I')
+
+# Linux SO_BUSY_POLL 选项（socket 模块未导出该常量）及忙轮询时长（微秒）
+_SO_BUSY_POLL = getattr(socket, 'SO_BUSY_POLL', 46)
+_BUSY_POLL_USEC = 50
+
+
+def _as_bytes(message: Union[str, bytes]) -> bytes:
+    """字节消息原样返回，字符串消息编码为 UTF-8"""
+    if isinstance(message, bytes):
+        return message
+    return message.encode('utf-8')
 
 
 class BaseClient(ABC):
     """客户端管理器基类 - 定义共同接口"""
     
+    LOG_PREFIX = "[通信]"
+    
     def __init__(self):
+        self.logger = _get_logger()
         self.socket: Optional[socket.socket] = None
         self.is_connected: bool = False
         self.is_enabled: bool = False
+        # connection_lock 保护连接的建立与断开；send_lock 只在一次收发期间持有，
+        # 重连时不会与正在进行的收发互相阻塞，也避免发送路径上重入 connection_lock
         self.connection_lock = threading.Lock()
+        self.send_lock = threading.Lock()
         self.reconnect_attempts: int = 0
         self.max_reconnect_attempts: int = 3
         self.reconnect_delay: float = 1.0
+        self._max_delay: float = 10.0
         self.debug_mode: bool = False
+        # 复用的响应接收缓冲区，recv_into 直接写入，避免每次接收分配新的 bytes
+        self._recv_buf = bytearray(4096)
+        self._recv_view = memoryview(self._recv_buf)
+        # 复用的长度前缀帧头缓冲区，只在持有 send_lock 时写入
+        self._len_buf = bytearray(_FRAME_HEADER.size)
+        
+        # 异步发送相关：生产者只向发件箱入队，套接字写入全部由后台发送线程完成，
+        # 接收线程负责读走服务器响应
+        self._outbox = queue.SimpleQueue()
+        self._async_lock = threading.Lock()  # 只保护后台线程的启动和停止
+        self._async_stop: Optional[threading.Event] = None  # 当前这组后台线程的停止信号
+        self._sender_thread: Optional[threading.Thread] = None
+        self._receiver_thread: Optional[threading.Thread] = None
         
         # 注册程序退出时的清理函数
         atexit.register(self.disconnect)
@@ -37,7 +97,7 @@ class BaseClient(ABC):
         pass
     
     @abstractmethod
-    def send_message(self, message: str) -> Optional[str]:
+    def send_message(self, message: Union[str, bytes]) -> Optional[Union[str, bytes]]:
         pass
     
     @abstractmethod
@@ -45,7 +105,7 @@ class BaseClient(ABC):
         pass
     
     @abstractmethod
-    def _retry_send(self, message: str) -> Optional[str]:
+    def _retry_send(self, message: Union[str, bytes]) -> Optional[Union[str, bytes]]:
         pass
     
     @abstractmethod
@@ -55,11 +115,165 @@ class BaseClient(ABC):
     @abstractmethod
     def get_status(self) -> dict:
         pass
+    
+    def _reconnect_delay(self) -> float:
+        """
+        计算本次重连前的等待时间（调用前 reconnect_attempts 已加一）
+        第一次重连立即进行；之后按指数退避，并乘以 0.5-1.5 的随机抖动，
+        避免大量客户端在同一时刻集中重连
+        """
+        if self.reconnect_attempts <= 1:
+            return 0.0
+        delay = min(self._max_delay, self.reconnect_delay * (2 ** (self.reconnect_attempts - 2)))
+        return delay * random.uniform(0.5, 1.5)
+    
+    def send_message_async(self, message: Union[str, bytes]) -> bool:
+        """
+        异步发送消息：放入发件箱后立即返回，不等待服务器响应
+        后台发送线程把发件箱中积累的消息以换行分隔合并，一次 sendall 发出
+        
+        :param message: 要发送的消息（str 或已编码的 UTF-8 bytes）
+        :return: 是否已放入发件箱
+        """
+        if not self.is_enabled:
+            return False
+        
+        self._outbox.put(message)
+        if self._sender_thread is None:
+            with self._async_lock:
+                if self._sender_thread is None:
+                    self._start_async_threads()
+        return True
+    
+    def _start_async_threads(self):
+        """启动后台发送和接收线程（调用方需持有 _async_lock）"""
+        stop = threading.Event()
+        self._async_stop = stop
+        self._sender_thread = threading.Thread(
+            target=self._sender_loop, args=(stop,), name=f"{type(self).__name__}-sender", daemon=True
+        )
+        self._receiver_thread = threading.Thread(
+            target=self._receiver_loop, args=(stop,), name=f"{type(self).__name__}-receiver", daemon=True
+        )
+        self._sender_thread.start()
+        self._receiver_thread.start()
+    
+    def _stop_async_threads(self):
+        """停止后台线程，发送线程退出前会发完发件箱中剩余的消息"""
+        with self._async_lock:
+            sender, receiver, stop = self._sender_thread, self._receiver_thread, self._async_stop
+            self._sender_thread = None
+            self._receiver_thread = None
+            self._async_stop = None
+        if sender is None:
+            return
+        stop.set()
+        self._outbox.put(_STOP_SENDER)
+        sender.join(timeout=1.0)
+        # 关闭读方向以唤醒阻塞在 recv_into 上的接收线程
+        sock = self.socket
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RD)
+            except OSError:
+                pass
+        receiver.join(timeout=1.0)
+    
+    def _sender_loop(self, stop: threading.Event):
+        """后台发送线程：阻塞等待发件箱有消息，取空当前积累的全部消息后合并发送"""
+        outbox = self._outbox
+        while True:
+            batch = [outbox.get()]
+            try:
+                while True:
+                    batch.append(outbox.get_nowait())
+            except queue.Empty:
+                pass
+            stopping = _STOP_SENDER in batch
+            if stopping:
+                batch = [message for message in batch if message is not _STOP_SENDER]
+            if batch:
+                self._send_batch(batch)
+            if stopping:
+                return
+    
+    def _send_payload(self, sock: socket.socket, payload: bytes):
+        """发送一条消息体：启用长度前缀分帧时加帧头发送，否则原样发送（调用方需持有 send_lock）"""
+        if config.SOCKET_LENGTH_PREFIX:
+            self._send_framed(sock, payload)
+        else:
+            sock.sendall(payload)
+    
+    def _send_framed(self, sock: socket.socket, payload: bytes):
+        """帧头与消息体通过一次 sendmsg 聚集写出，只产生一次系统调用和一个 TCP 段（仅 POSIX）"""
+        header = self._len_buf
+        _FRAME_HEADER.pack_into(header, 0, len(payload))
+        if not hasattr(sock, 'sendmsg'):
+            # Windows 上没有 sendmsg，拼接后一次 sendall 发出
+            sock.sendall(bytes(header) + payload)
+            return
+        sent = sock.sendmsg([header, payload])
+        if sent < len(header) + len(payload):
+            # 发送缓冲区不足时只写出了一部分，剩余部分交给 sendall 补齐
+            sock.sendall((bytes(header) + payload)[sent:])
+    
+    def _send_batch(self, batch: List[Union[str, bytes]]):
+        """把一批消息合并为一次发送（按换行或长度前缀分帧），连接断开时重连后重试一次"""
+        payloads = [_as_bytes(message) for message in batch]
+        if config.SOCKET_LENGTH_PREFIX:
+            data = b''.join(_FRAME_HEADER.pack(len(payload)) + payload for payload in payloads)
+        else:
+            data = b'\n'.join(payloads) + b'\n'
+        for _ in range(2):
+            if not self.is_connected and not self._reconnect():
+                return
+            try:
+                with self.send_lock:
+                    if not self.socket:
+                        return
+                    self.socket.sendall(data)
+                if self.debug_mode:
+                    self.logger.debug("%s 异步发送 %d 条消息", self.LOG_PREFIX, len(batch))
+                return
+            except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
+                if self.debug_mode:
+                    print(f"{self.LOG_PREFIX} 连接已断开，尝试重连...")
+                self.is_connected = False
+            except Exception as e:
+                print(f"{self.LOG_PREFIX} 异步发送消息失败: {e}")
+                return
+    
+    def _receiver_loop(self, stop: threading.Event):
+        """后台接收线程：持续读走服务器响应，避免响应堆积占满接收缓冲区"""
+        view = self._recv_view
+        while not stop.is_set():
+            sock = self.socket
+            if sock is None or not self.is_connected:
+                stop.wait(0.1)
+                continue
+            try:
+                n = sock.recv_into(view)
+            except socket.timeout:
+                continue
+            except OSError:
+                stop.wait(0.1)
+                continue
+            if not n:
+                if stop.is_set():
+                    return
+                # 服务器关闭了连接，由发送线程在下次发送时重连
+                if sock is self.socket:
+                    self.is_connected = False
+                continue
+            if self.debug_mode:
+                self.logger.debug("%s 收到响应: '%s'", self.LOG_PREFIX, str(view[:n], 'utf-8', 'replace'))
 
 
 class SocketClient(BaseClient):
     """Socket客户端管理器 - 支持持久连接和自动重连"""
     
+    LOG_PREFIX = "[SOCKET]"
+    
     def __init__(self):
         super().__init__()
         self.host: str = config.SOCKET_HOST
@@ -111,6 +325,7 @@ class SocketClient(BaseClient):
                     print(f"[SOCKET] 正在连接到服务器 {self.host}:{self.port}...")
                 
                 self.socket.connect((self.host, self.port))
+                self._tune_socket(self.socket)
                 self.is_connected = True
                 self.reconnect_attempts = 0
                 
@@ -126,39 +341,63 @@ class SocketClient(BaseClient):
             print(f"[SOCKET] 连接失败: {e}")
             return False
     
-    def send_message(self, message: str) -> Optional[str]:
+    @staticmethod
+    def _tune_socket(sock: socket.socket):
+        """设置低延迟选项：手势消息很短，关闭 Nagle 算法以免小包被延迟合并"""
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Linux 上立即回复 ACK，避免与服务器端的延迟确认叠加
+        if hasattr(socket, 'TCP_QUICKACK'):
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+            except OSError:
+                pass
+        # 低延迟模式：Linux 上让阻塞接收在网卡队列上忙轮询一段时间，以 CPU 换取更低的响应延迟
+        if config.SOCKET_LOW_LATENCY and sys.platform.startswith('linux'):
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, _SO_BUSY_POLL, _BUSY_POLL_USEC)
+            except OSError as e:
+                # 超过系统 net.core.busy_read 的取值需要 CAP_NET_ADMIN 权限
+                print(f"[SOCKET] 无法启用忙轮询: {e}")
+    
+    def send_message(self, message: Union[str, bytes]) -> Optional[Union[str, bytes]]:
         """
         发送消息到服务器
         
-        :param message: 要发送的消息
-        :return: 服务器响应，如果失败则返回None
+        :param message: 要发送的消息（str 或已编码的 UTF-8 bytes）
+        :return: 服务器响应（与 message 类型相同），如果失败则返回None
         """
         if not self.is_enabled or not self.socket:
             return None
         
+        # 检查连接状态（重连过程自行获取 connection_lock，这里不能持有它）
+        if not self.is_connected:
+            if not self._reconnect():
+                return None
+        
         try:
-            with self.connection_lock:
-                # 检查连接状态
-                if not self.is_connected:
-                    if not self._reconnect():
-                        return None
-                
-                # 确保socket对象存在
-                if not self.socket:
+            with self.send_lock:
+                # 确保socket对象存在；热路径上用到的属性只读取一次，之后使用局部变量
+                sock = self.socket
+                if sock is None:
                     return None
+                debug = self.debug_mode
+                view = self._recv_view
                 
                 # 发送消息
-                if self.debug_mode:
-                    print(f"[SOCKET] 发送消息: '{message}'")
+                if debug:
+                    self.logger.debug("%s 发送消息: '%s'", self.LOG_PREFIX, message)
                 
-                self.socket.sendall(message.encode('utf-8'))
+                self._send_payload(sock, _as_bytes(message))
                 
-                # 接收响应
-                data = self.socket.recv(1024)
-                response = data.decode('utf-8')
+                # 接收响应：字节消息直接返回响应字节，字符串消息返回解码后的字符串
+                n = sock.recv_into(view)
+                if isinstance(message, bytes):
+                    response = bytes(view[:n])
+                else:
+                    response = str(view[:n], 'utf-8')
                 
-                if self.debug_mode:
-                    print(f"[SOCKET] 收到响应: '{response}'")
+                if debug:
+                    self.logger.debug("%s 收到响应: '%s'", self.LOG_PREFIX, response)
                 
                 return response
                 
@@ -182,10 +421,12 @@ class SocketClient(BaseClient):
         if self.debug_mode:
             print(f"[SOCKET] 尝试重连 ({self.reconnect_attempts}/{self.max_reconnect_attempts})...")
         
-        time.sleep(self.reconnect_delay)
+        delay = self._reconnect_delay()
+        if delay:
+            time.sleep(delay)
         return self._connect()
     
-    def _retry_send(self, message: str) -> Optional[str]:
+    def _retry_send(self, message: Union[str, bytes]) -> Optional[Union[str, bytes]]:
         """重试发送消息"""
         if self._reconnect():
             return self.send_message(message)
@@ -193,8 +434,9 @@ class SocketClient(BaseClient):
     
     def disconnect(self):
         """断开Socket连接"""
+        self._stop_async_threads()
         try:
-            with self.connection_lock:
+            with self.connection_lock, self.send_lock:
                 if self.socket and self.is_connected:
                     if self.debug_mode:
                         print("[SOCKET] 正在断开连接...")
@@ -222,6 +464,8 @@ class SocketClient(BaseClient):
 class BluetoothClient(BaseClient):
     """蓝牙客户端管理器 - 支持持久连接和自动重连"""
     
+    LOG_PREFIX = "[蓝牙]"
+    
     def __init__(self):
         super().__init__()
         self.server_mac: str = config.BLUETOOTH_MAC
@@ -298,39 +542,45 @@ class BluetoothClient(BaseClient):
             print(f"[蓝牙] 连接失败: {e}")
             return False
     
-    def send_message(self, message: str) -> Optional[str]:
+    def send_message(self, message: Union[str, bytes]) -> Optional[Union[str, bytes]]:
         """
         发送消息到蓝牙服务器
         
-        :param message: 要发送的消息
-        :return: 服务器响应，如果失败则返回None
+        :param message: 要发送的消息（str 或已编码的 UTF-8 bytes）
+        :return: 服务器响应（与 message 类型相同），如果失败则返回None
         """
         if not self.is_enabled or not self.socket:
             return None
         
+        # 检查连接状态（重连过程自行获取 connection_lock，这里不能持有它）
+        if not self.is_connected:
+            if not self._reconnect():
+                return None
+        
         try:
-            with self.connection_lock:
-                # 检查连接状态
-                if not self.is_connected:
-                    if not self._reconnect():
-                        return None
-                
-                # 确保socket对象存在
-                if not self.socket:
+            with self.send_lock:
+                # 确保socket对象存在；热路径上用到的属性只读取一次，之后使用局部变量
+                sock = self.socket
+                if sock is None:
                     return None
+                debug = self.debug_mode
+                view = self._recv_view
                 
                 # 发送消息
-                if self.debug_mode:
-                    print(f"[蓝牙] 发送消息: '{message}'")
+                if debug:
+                    self.logger.debug("%s 发送消息: '%s'", self.LOG_PREFIX, message)
                 
-                self.socket.sendall(message.encode('utf-8'))
+                self._send_payload(sock, _as_bytes(message))
                 
-                # 接收响应
-                data = self.socket.recv(1024)
-                response = data.decode('utf-8')
+                # 接收响应：字节消息直接返回响应字节，字符串消息返回解码后的字符串
+                n = sock.recv_into(view)
+                if isinstance(message, bytes):
+                    response = bytes(view[:n])
+                else:
+                    response = str(view[:n], 'utf-8')
                 
-                if self.debug_mode:
-                    print(f"[蓝牙] 收到响应: '{response}'")
+                if debug:
+                    self.logger.debug("%s 收到响应: '%s'", self.LOG_PREFIX, response)
                 
                 return response
                 
@@ -354,10 +604,12 @@ class BluetoothClient(BaseClient):
         if self.debug_mode:
             print(f"[蓝牙] 尝试重连 ({self.reconnect_attempts}/{self.max_reconnect_attempts})...")
         
-        time.sleep(self.reconnect_delay)
+        delay = self._reconnect_delay()
+        if delay:
+            time.sleep(delay)
         return self._connect()
     
-    def _retry_send(self, message: str) -> Optional[str]:
+    def _retry_send(self, message: Union[str, bytes]) -> Optional[Union[str, bytes]]:
         """重试发送消息"""
         if self._reconnect():
             return self.send_message(message)
@@ -365,8 +617,9 @@ class BluetoothClient(BaseClient):
     
     def disconnect(self):
         """断开蓝牙连接"""
+        self._stop_async_threads()
         try:
-            with self.connection_lock:
+            with self.connection_lock, self.send_lock:
                 if self.socket and self.is_connected:
                     if self.debug_mode:
                         print("[蓝牙] 正在断开连接...")
@@ -391,13 +644,55 @@ class BluetoothClient(BaseClient):
         }
 
 
-# 全局客户端实例
+# 全局客户端实例（当前使用的客户端）
 _client: Optional[BaseClient] = None
+# 连接池：按 (连接类型, 地址, 端口) 保存已建立的客户端，切换目标时复用已有连接而不是断开重连
+_clients: Dict[Tuple[str, str, int], BaseClient] = {}
+
+
+def _disconnect_all(clients: Dict[Tuple[str, str, int], BaseClient]):
+    """断开连接池中的所有客户端连接"""
+    for client in list(clients.values()):
+        client.disconnect()
+
+
+class _ThreadClientPool:
+    """单个线程独占的连接池（config.SOCKET_PER_THREAD）；线程退出、本对象随线程局部存储被回收时断开其中的连接"""
+    
+    def __init__(self):
+        self.clients: Dict[Tuple[str, str, int], BaseClient] = {}
+        self.current: Optional[BaseClient] = None
+        weakref.finalize(self, _disconnect_all, self.clients)
+
+
+# 按线程划分的连接池：每个生产者线程使用自己的连接，发送路径上不与其他线程争用锁
+_thread_local = threading.local()
+_thread_pools: "weakref.WeakSet[_ThreadClientPool]" = weakref.WeakSet()
+_thread_pools_lock = threading.Lock()
+
+
+def _thread_pool() -> _ThreadClientPool:
+    """获取当前线程的连接池，首次调用时创建"""
+    pool = getattr(_thread_local, 'pool', None)
+    if pool is None:
+        pool = _thread_local.pool = _ThreadClientPool()
+        with _thread_pools_lock:
+            _thread_pools.add(pool)
+    return pool
+
+
+def _current_client() -> Optional[BaseClient]:
+    """获取当前使用的客户端：按线程划分连接时为本线程的客户端，否则为全局客户端"""
+    if config.SOCKET_PER_THREAD:
+        pool = getattr(_thread_local, 'pool', None)
+        return pool.current if pool is not None else None
+    return _client
 
 
 def initialize_client(host: Optional[str] = None, port: Optional[int] = None, debug_mode: bool = False) -> bool:
     """
     根据配置初始化合适的客户端（Socket或蓝牙）
+    同一目标的客户端只创建一次，再次切换到该目标时直接复用连接池中的连接
     
     :param host: 服务器地址（IP地址或MAC地址）
     :param port: 服务器端口
@@ -406,65 +701,87 @@ def initialize_client(host: Optional[str] = None, port: Optional[int] = None, de
     """
     global _client
     
+    # 按线程划分连接时使用本线程的连接池，否则使用全局连接池
+    pool = _thread_pool() if config.SOCKET_PER_THREAD else None
+    clients = pool.clients if pool is not None else _clients
+    
     # 根据配置决定使用哪种客户端
     print(config.CONNECTION_TYPE.lower())
     connection_type = config.CONNECTION_TYPE.lower()
     
-    if _client is not None:
-        # 如果已有客户端且类型匹配，直接使用现有客户端
-        if (connection_type == 'socket' and isinstance(_client, SocketClient)) or \
-           (connection_type == 'bluetooth' and isinstance(_client, BluetoothClient)):
-            return _client.initialize(host=host, port=port, debug_mode=debug_mode)
-        
-        # 如果类型不匹配，断开现有连接
-        _client.disconnect()
-        _client = None
-    
-    # 创建新的客户端实例
     if connection_type == 'bluetooth':
-        print(f"[通信] 使用蓝牙连接模式")
-        _client = BluetoothClient()
+        key = ('bluetooth', host or config.BLUETOOTH_MAC, port or config.BLUETOOTH_PORT)
     else:  # 默认使用socket
-        print(f"[通信] 使用Socket连接模式")
-        _client = SocketClient()
+        key = ('socket', host or config.SOCKET_HOST, port or config.SOCKET_PORT)
     
-    return _client.initialize(host=host, port=port, debug_mode=debug_mode)
+    client = clients.get(key)
+    if client is not None and client.is_enabled and client.is_connected:
+        # 连接池中已有到该目标的可用连接
+        if pool is not None:
+            pool.current = client
+        else:
+            _client = client
+        return True
+    
+    # 创建新的客户端实例
+    if client is None:
+        if connection_type == 'bluetooth':
+            print(f"[通信] 使用蓝牙连接模式")
+            client = BluetoothClient()
+        else:
+            print(f"[通信] 使用Socket连接模式")
+            client = SocketClient()
+        clients[key] = client
+    
+    if pool is not None:
+        pool.current = client
+    else:
+        _client = client
+    return client.initialize(host=key[1], port=key[2], debug_mode=debug_mode)
 
 
-def send_message(message: str, host: Optional[str] = None, port: Optional[int] = None, debug_mode: bool = False) -> Optional[str]:
+def send_message(message: Union[str, bytes], host: Optional[str] = None, port: Optional[int] = None,
+                 debug_mode: bool = False) -> Optional[Union[str, bytes]]:
     """
     发送消息到服务器（Socket或蓝牙）
+    启用 config.SOCKET_ASYNC_SEND 时消息交给后台线程合并发送，立即返回 None
     
-    :param message: 要发送的消息
+    :param message: 要发送的消息（str 或已编码的 UTF-8 bytes，bytes 可省去编码开销）
     :param host: 服务器地址（如果未初始化则使用此参数）
     :param port: 服务器端口（如果未初始化则使用此参数）
     :param debug_mode: 是否启用调试模式
-    :return: 服务器响应
+    :return: 服务器响应，类型与 message 相同（异步发送时为 None）
     """
-    global _client
+    client = _current_client()
     
     # 如果客户端未初始化，尝试初始化
-    if _client is None or not _client.is_enabled:
+    if client is None or not client.is_enabled:
         if not initialize_client(host=host, port=port, debug_mode=debug_mode):
             return None
+        client = _current_client()
     
-    if _client:
-        return _client.send_message(message)
+    if client:
+        if config.SOCKET_ASYNC_SEND:
+            client.send_message_async(message)
+            return None
+        return client.send_message(message)
     return None
 
 
 def disconnect_client():
-    """断开客户端连接"""
-    global _client
-    if _client:
-        _client.disconnect()
+    """断开连接池（包括各线程的连接池）中的所有客户端连接"""
+    _disconnect_all(_clients)
+    with _thread_pools_lock:
+        pools = list(_thread_pools)
+    for pool in pools:
+        _disconnect_all(pool.clients)
 
 
 def get_client_status() -> dict:
     """获取客户端状态"""
-    global _client
-    if _client:
-        status = _client.get_status()
-        status['type'] = 'bluetooth' if isinstance(_client, BluetoothClient) else 'socket'
+    client = _current_client()
+    if client:
+        status = client.get_status()
+        status['type'] = 'bluetooth' if isinstance(client, BluetoothClient) else 'socket'
         return status
     return {'enabled': False, 'connected': False, 'type': 'none'}
\ No newline at end of file
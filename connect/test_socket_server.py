@@ -1,4 +1,7 @@
+import os
+import selectors
 import socket
+import sys
 import threading
 
 def start_server(host='127.0.0.1', port=65432, connection_handler=None):
@@ -33,30 +36,238 @@ def handle_connection(conn, addr):
     你可以根据你的需求，编写自己的处理逻辑。
     """
     print(f"客户端 {addr} 已连接。")
+    # 关闭 Nagle 算法，短响应立即发出
+    conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    # 每个连接预先分配一块接收缓冲区，recv_into 直接写入其中，避免每次接收都分配新的 bytes
+    buffer = bytearray(4096)
+    view = memoryview(buffer)
     with conn:
         while True:
-            # recv(1024) 表示一次最多接收 1024 字节的数据
-            # 如果客户端关闭了连接，recv() 会返回一个空字节串 b''
-            data = conn.recv(1024)
-            if not data:
+            # recv_into 返回实际接收的字节数
+            # 如果客户端关闭了连接，返回 0
+            n = conn.recv_into(view)
+            if not n:
                 print(f"客户端 {addr} 已断开连接。")
                 break
             
             # 将收到的字节数据解码为UTF-8字符串
-            message = data.decode('utf-8')
-            print(f"收到来自 {addr} 的消息: {message}")
-            
+            message = str(view[:n], 'utf-8')
             # 准备并发送响应
-            response = f"服务器已收到您的消息: '{message}'"
-            # 将响应字符串编码为字节数据并发送
-            conn.sendall(response.encode('utf-8'))
+            conn.sendall(handle_message(message, addr))
+
+def handle_framed_connection(conn, addr):
+    """
+    处理使用长度前缀分帧的客户端连接（config.SOCKET_LENGTH_PREFIX = True）：
+    每条消息前有 4 字节小端长度，按长度读出完整消息后再响应。
+    """
+    print(f"客户端 {addr} 已连接（长度前缀分帧）。")
+    conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    header = bytearray(4)
+    buffer = bytearray(4096)
+    with conn:
+        while recv_exactly(conn, memoryview(header)):
+            length = int.from_bytes(header, 'little')
+            if length > len(buffer):
+                buffer = bytearray(length)
+            view = memoryview(buffer)[:length]
+            if not recv_exactly(conn, view):
+                break
+            conn.sendall(handle_message(str(view, 'utf-8'), addr))
+        print(f"客户端 {addr} 已断开连接。")
+
+def recv_exactly(conn, view):
+    """
+    把 view 填满后返回 True；连接在此之前关闭则返回 False。
+    """
+    received = 0
+    while received < len(view):
+        n = conn.recv_into(view[received:])
+        if not n:
+            return False
+        received += n
+    return True
+
+def handle_message(message, addr):
+    """
+    处理一条收到的消息，返回要发送给客户端的响应字节。
+    """
+    print(f"收到来自 {addr} 的消息: {message}")
+    response = f"服务器已收到您的消息: '{message}'"
+    # 将响应字符串编码为字节数据
+    return response.encode('utf-8')
+
+def framing_from_config():
+    """
+    根据客户端配置选择分帧方式：
+    'length' 对应 config.SOCKET_LENGTH_PREFIX，'newline' 对应 config.SOCKET_ASYNC_SEND（换行分隔的批量发送），
+    否则为 'raw'（每次接收到的数据视为一条消息）。找不到 config 模块时使用 'raw'。
+    """
+    try:
+        import config
+    except ImportError:
+        return 'raw'
+    if getattr(config, 'SOCKET_LENGTH_PREFIX', False):
+        return 'length'
+    if getattr(config, 'SOCKET_ASYNC_SEND', False):
+        return 'newline'
+    return 'raw'
+
+def split_messages(framing, pending, data):
+    """
+    把新收到的数据追加到连接的待处理缓冲区，取出其中所有完整的消息。
+
+    :param framing: 分帧方式，'raw'、'newline' 或 'length'。
+    :param pending: 该连接的待处理缓冲区 (bytearray)，不完整的消息留在其中等待后续数据。
+    :param data: 本次收到的数据。
+    :return: 完整消息 (bytes) 的列表。
+    """
+    if framing == 'raw':
+        return [data]
+
+    pending += data
+    messages = []
+    if framing == 'newline':
+        end = pending.rfind(b'\n')
+        if end >= 0:
+            messages = bytes(pending[:end]).split(b'\n')
+            del pending[:end + 1]
+        return messages
+
+    # 'length'：4 字节小端长度 + 消息体
+    offset = 0
+    while len(pending) - offset >= 4:
+        length = int.from_bytes(pending[offset:offset + 4], 'little')
+        if len(pending) - offset - 4 < length:
+            break
+        messages.append(bytes(pending[offset + 4:offset + 4 + length]))
+        offset += 4 + length
+    del pending[:offset]
+    return messages
+
+def start_event_loop_server(host='127.0.0.1', port=65432, message_handler=handle_message, framing='raw'):
+    """
+    启动单线程事件循环 TCP 服务器：用 selectors 同时监听所有连接，
+    不再为每个客户端创建线程，空闲连接只占用一个文件描述符。
+
+    :param host: 服务器绑定的主机名或IP地址 (默认为 '127.0.0.1')。
+    :param port: 服务器监听的端口号 (默认为 65432)。
+    :param message_handler: 一个函数，接受 message (str) 和 addr，返回响应字节。
+    :param framing: 分帧方式，'raw'、'newline' 或 'length'，需与客户端配置一致（见 framing_from_config）。
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+        server.bind((host, port))
+        server.listen()
+        print(f"服务器已在 {host}:{port} 启动（事件循环模式，分帧: {framing}），等待客户端连接...")
+        run_event_loop(server, message_handler, framing)
+
+def start_reuseport_server(host='127.0.0.1', port=65432, n_workers=None, message_handler=handle_message,
+                           framing='raw'):
+    """
+    启动多线程 SO_REUSEPORT TCP 服务器（仅 Linux 等支持 SO_REUSEPORT 的系统）：
+    每个工作线程绑定自己的监听套接字并运行独立的事件循环，
+    由内核在各监听套接字之间分配新连接，不再由单个 accept() 线程分发。
+
+    :param host: 服务器绑定的主机名或IP地址 (默认为 '127.0.0.1')。
+    :param port: 服务器监听的端口号 (默认为 65432)。
+    :param n_workers: 工作线程数 (默认为 CPU 核心数)。
+    :param message_handler: 一个函数，接受 message (str) 和 addr，返回响应字节。
+    :param framing: 分帧方式，'raw'、'newline' 或 'length'。
+    """
+    if not hasattr(socket, 'SO_REUSEPORT'):
+        raise RuntimeError("当前系统不支持 SO_REUSEPORT，请改用 start_event_loop_server")
+    n_workers = n_workers or os.cpu_count() or 1
+
+    servers = []
+    for _ in range(n_workers):
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # 必须在 bind 之前设置，所有监听套接字才能绑定同一端口
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        server.bind((host, port))
+        server.listen()
+        servers.append(server)
+    print(f"服务器已在 {host}:{port} 启动（SO_REUSEPORT，{n_workers} 个工作线程），等待客户端连接...")
+
+    workers = [
+        threading.Thread(target=_reuseport_worker, args=(server, index, message_handler, framing), daemon=True)
+        for index, server in enumerate(servers)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+def _reuseport_worker(server, index, message_handler, framing):
+    """
+    SO_REUSEPORT 工作线程：绑定到一个 CPU 核心（如果支持）后运行自己的事件循环。
+    """
+    if hasattr(os, 'sched_setaffinity'):
+        cpus = sorted(os.sched_getaffinity(0))
+        try:
+            # Linux 上 pid 0 表示调用线程本身，只影响当前工作线程
+            os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+        except OSError:
+            pass
+    with server:
+        run_event_loop(server, message_handler, framing)
+
+def run_event_loop(server, message_handler=handle_message, framing='raw'):
+    """
+    在一个已开始监听的套接字上运行 selectors 事件循环，直到线程结束。
+    单个连接的数据无法解析时只关闭该连接，不影响事件循环和其他连接。
+
+    :param server: 已调用 listen() 的监听套接字。
+    :param message_handler: 一个函数，接受 message (str) 和 addr，返回响应字节。
+    :param framing: 分帧方式，'raw'、'newline' 或 'length'。
+    """
+    # 所有连接在同一线程中依次处理，共用一块接收缓冲区
+    buffer = bytearray(4096)
+    view = memoryview(buffer)
+
+    with selectors.DefaultSelector() as selector:
+        server.setblocking(False)
+        selector.register(server, selectors.EVENT_READ, data=None)
+
+        while True:
+            for key, _ in selector.select():
+                if key.data is None:
+                    # 监听套接字可读：有新连接
+                    conn, addr = server.accept()
+                    print(f"客户端 {addr} 已连接。")
+                    # 只在可读时才 recv，响应也很短，连接本身保持阻塞模式即可
+                    conn.setblocking(True)
+                    conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    # 每个连接保存地址和尚未凑成完整消息的数据
+                    selector.register(conn, selectors.EVENT_READ, data=(addr, bytearray()))
+                    continue
+
+                conn, (addr, pending) = key.fileobj, key.data
+                try:
+                    n = conn.recv_into(view)
+                except ConnectionError:
+                    n = 0
+                if not n:
+                    print(f"客户端 {addr} 已断开连接。")
+                    selector.unregister(conn)
+                    conn.close()
+                    continue
+                try:
+                    for message in split_messages(framing, pending, view[:n]):
+                        conn.sendall(message_handler(str(message, 'utf-8'), addr))
+                except (UnicodeDecodeError, ConnectionError) as e:
+                    print(f"客户端 {addr} 的数据处理失败，关闭连接: {e}")
+                    selector.unregister(conn)
+                    conn.close()
 
 # --- 如何使用 ---
 if __name__ == "__main__":
-    # 将我们自定义的 handle_connection 函数作为参数传递给 start_server
+    # 使用单线程事件循环服务器；如需每个连接一个线程的处理方式，
+    # 可改为 start_server(host, port, connection_handler=handle_connection)
+    # 连接数很多时，可在 Linux 上改为 start_reuseport_server(host, port) 使用多个监听线程
     # 程序会在这里进入一个无限循环，等待连接
+    # 分帧方式与 config.py 中的客户端配置保持一致（config.py 位于上一级目录）
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     try:
-        start_server(host='127.0.0.1', port=65432, connection_handler=handle_connection)
+        start_event_loop_server(host='127.0.0.1', port=65432, framing=framing_from_config())
     except KeyboardInterrupt:
         print("\n服务器被手动关闭。")
     except Exception as e:
@@ -3,19 +3,23 @@ import time
 
 import cv2
 import mediapipe as mp
+import numpy as np
 
 # 导入新的 Task API 模块
 from mediapipe.tasks import python
 from mediapipe.tasks.python import vision
 from mediapipe.framework.formats import landmark_pb2
 
+from hand_kernels import finger_up_mask
+
 class HandDetector:
     """
     使用新的 MediaPipe Task API 进行手部检测。
     支持 GPU Delegate 设置。
     """
 
-    def __init__(self, maxHands=2, detectionCon=0.5, minTrackCon=0.5):
+    def __init__(self, maxHands=2, detectionCon=0.5, minTrackCon=0.5, liveStream=False,
+                 modelPath='cvzone/hand_landmarker.task', useOpenCL=False):
         """
         :param staticMode: 对于视频流，推荐为 False。这会影响 running_mode。
         :param maxHands: 要检测的最大手数。
@@ -23,10 +27,21 @@ class HandDetector:
                                 这里我们使用一个标准模型，这个参数不再直接使用。
         :param detectionCon: 最低检测置信度。
         :param minTrackCon: 最低跟踪置信度。
+        :param liveStream: 是否使用 LIVE_STREAM 异步模式。异步模式下检测在 MediaPipe 内部线程进行，
+                           findHands 不等待本帧结果，直接返回最近一次完成的检测结果。
+        :param modelPath: HandLandmarker 模型包 (.task) 路径，可替换为量化后的模型以降低 CPU 推理开销。
+        :param useOpenCL: 是否用 cv2.UMat 在 OpenCL 设备上完成检测前的缩放和颜色转换（设备不支持时自动关闭）。
         """
         self.maxHands = maxHands
         self.detectionCon = detectionCon
         self.minTrackCon = minTrackCon
+        self.liveStream = liveStream
+        self.modelPath = modelPath
+        self.useOpenCL = useOpenCL and cv2.ocl.haveOpenCL()
+        if self.useOpenCL:
+            cv2.ocl.setUseOpenCL(True)
+        self._latest_result = None # LIVE_STREAM 模式下回调写入的最新检测结果
+        self._last_timestamp_ms = -1 # 上一次送入检测器的时间戳，保证严格递增
 
         # 1. 尝试使用 GPU delegate，失败时回退到 CPU
         self.using_gpu = False
@@ -35,12 +50,12 @@ class HandDetector:
         # 首先尝试 GPU delegate
         try:
             base_options = python.BaseOptions(
-                model_asset_path='cvzone/hand_landmarker.task',
+                model_asset_path=self.modelPath,
                 delegate=python.BaseOptions.Delegate.GPU
             )
             
             # 2. 根据是处理静态图片还是视频流，设置不同的 running_mode
-            running_mode = vision.RunningMode.VIDEO
+            running_mode = vision.RunningMode.LIVE_STREAM if liveStream else vision.RunningMode.VIDEO
             
             # 3. 创建 HandLandmarkerOptions
             options = vision.HandLandmarkerOptions(
@@ -48,7 +63,8 @@ class HandDetector:
                 running_mode=running_mode,
                 num_hands=self.maxHands,
                 min_hand_detection_confidence=self.detectionCon,
-                min_tracking_confidence=self.minTrackCon
+                min_tracking_confidence=self.minTrackCon,
+                result_callback=self._on_result if liveStream else None
             )
             
             # 4. 创建检测器实例
@@ -63,18 +79,19 @@ class HandDetector:
             try:
                 # 回退到 CPU delegate
                 base_options = python.BaseOptions(
-                    model_asset_path='cvzone/hand_landmarker.task',
+                    model_asset_path=self.modelPath,
                     delegate=python.BaseOptions.Delegate.CPU
                 )
                 
-                running_mode = vision.RunningMode.VIDEO
+                running_mode = vision.RunningMode.LIVE_STREAM if liveStream else vision.RunningMode.VIDEO
                 
                 options = vision.HandLandmarkerOptions(
                     base_options=base_options,
                     running_mode=running_mode,
                     num_hands=self.maxHands,
                     min_hand_detection_confidence=self.detectionCon,
-                    min_tracking_confidence=self.minTrackCon
+                    min_tracking_confidence=self.minTrackCon,
+                    result_callback=self._on_result if liveStream else None
                 )
                 
                 self.detector = vision.HandLandmarker.create_from_options(options)
@@ -87,12 +104,16 @@ class HandDetector:
 
         self.tipIds = [4, 8, 12, 16, 20]
         self.results = None # 用于存储最新的检测结果
+        self._small_buf = None # 缩小后图像的复用缓冲区
+        self._rgb_buf = None # RGB 转换结果的复用缓冲区
 
-    def findHands(self, img, draw=True, flipType=True):
+    def findHands(self, img, draw=True, flipType=True, scale=1.0):
         """
         在 BGR 图像中找到手部。
         :param img: 要查找手的图像。
         :param draw: 是否在图像上绘制结果的标志。
+        :param flipType: 是否翻转左右手类型。
+        :param scale: 送入检测器前的缩放比例 (<1 时先缩小再检测)，关键点坐标仍对应原图。
         :return: 包含所有手部信息的列表，以及绘制了结果的图像。
         """
         # 检查检测器是否已成功初始化
@@ -100,40 +121,63 @@ class HandDetector:
             print("⚠ 检测器未初始化，返回空结果")
             return [], img
             
-        imgRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
         h, w, c = img.shape
+        # 缩小后再检测；检测结果为归一化坐标，按原图尺寸换算即可映射回全分辨率
+        downscale = 0 < scale < 1
+        if downscale:
+            small_w, small_h = max(1, int(w * scale)), max(1, int(h * scale))
+        
+        if self.useOpenCL:
+            # 缩放和颜色转换在 OpenCL 设备上完成，送入 MediaPipe 前取回为 numpy 数组
+            src = cv2.UMat(img)
+            if downscale:
+                src = cv2.resize(src, (small_w, small_h), interpolation=cv2.INTER_AREA)
+            imgRGB = cv2.cvtColor(src, cv2.COLOR_BGR2RGB).get()
+        else:
+            if downscale:
+                if self._small_buf is None or self._small_buf.shape != (small_h, small_w, c):
+                    self._small_buf = np.empty((small_h, small_w, c), dtype=img.dtype)
+                small = cv2.resize(img, (small_w, small_h), dst=self._small_buf,
+                                   interpolation=cv2.INTER_AREA)
+            else:
+                small = img
+            # 颜色转换写入复用的缓冲区，避免每帧分配新数组
+            if self._rgb_buf is None or self._rgb_buf.shape != small.shape:
+                self._rgb_buf = np.empty_like(small)
+            imgRGB = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
         
         # 将 OpenCV 图像转换为 MediaPipe Image 对象
         mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=imgRGB)
         
-        # 为视频模式生成时间戳
-        timestamp_ms = int(time.time() * 1000)
+        # 为视频/直播模式生成时间戳（两种模式都要求严格递增）
+        timestamp_ms = max(int(time.time() * 1000), self._last_timestamp_ms + 1)
+        self._last_timestamp_ms = timestamp_ms
         
         # 使用新的检测器进行检测
         try:
-            self.results = self.detector.detect_for_video(mp_image, timestamp_ms)
+            if self.liveStream:
+                # 异步提交本帧，使用最近一次回调返回的结果
+                self.detector.detect_async(mp_image, timestamp_ms)
+                self.results = self._latest_result
+            else:
+                self.results = self.detector.detect_for_video(mp_image, timestamp_ms)
         except Exception as e:
             print(f"⚠ 手部检测失败: {e}")
             return [], img
 
         allHands = []
-        if self.results.hand_landmarks:
+        if self.results is not None and self.results.hand_landmarks:
             # 新的 API 返回结果结构不同
             for handedness, hand_landmarks in zip(self.results.handedness, self.results.hand_landmarks):
                 myHand = {}
-                # lmList
-                mylmList = []
-                xList = []
-                yList = []
-                for id, lm in enumerate(hand_landmarks):
-                    px, py, pz = int(lm.x * w), int(lm.y * h), int(lm.z * w)
-                    mylmList.append([px, py, pz])
-                    xList.append(px)
-                    yList.append(py)
+                # lmList: (21, 3) int32 数组，下游直接按数组处理
+                mylmList = np.asarray(
+                    [(lm.x * w, lm.y * h, lm.z * w) for lm in hand_landmarks], dtype=np.int32
+                )
 
                 # bbox
-                xmin, xmax = min(xList), max(xList)
-                ymin, ymax = min(yList), max(yList)
+                xmin, ymin = mylmList[:, :2].min(axis=0).tolist()
+                xmax, ymax = mylmList[:, :2].max(axis=0).tolist()
                 boxW, boxH = xmax - xmin, ymax - ymin
                 bbox = xmin, ymin, boxW, boxH
                 cx, cy = bbox[0] + (bbox[2] // 2), bbox[1] + (bbox[3] // 2)
@@ -163,6 +207,10 @@ class HandDetector:
         
         return allHands, img
 
+    def _on_result(self, result, output_image, timestamp_ms):
+        """LIVE_STREAM 模式的结果回调（在 MediaPipe 内部线程中调用）"""
+        self._latest_result = result
+
     def draw_landmarks(self, rgb_image, hand_landmarks):
         """辅助函数，用于在新版 API 上绘制关键点"""
         hand_landmarks_proto = landmark_pb2.NormalizedLandmarkList()
@@ -177,29 +225,10 @@ class HandDetector:
             mp.solutions.drawing_styles.get_default_hand_connections_style())
 
     def fingersUp(self, myHand):
-        fingers = []
-        myHandType = myHand["type"]
         myLmList = myHand["lmList"]
-        if myLmList: # 确保列表不为空
-            # Thumb
-            if myHandType == "Right":
-                if myLmList[self.tipIds[0]][0] > myLmList[self.tipIds[0] - 1][0]:
-                    fingers.append(1)
-                else:
-                    fingers.append(0)
-            else: # Left Hand
-                if myLmList[self.tipIds[0]][0] < myLmList[self.tipIds[0] - 1][0]:
-                    fingers.append(1)
-                else:
-                    fingers.append(0)
-
-            # 4 Fingers
-            for id in range(1, 5):
-                if myLmList[self.tipIds[id]][1] < myLmList[self.tipIds[id] - 2][1]:
-                    fingers.append(1)
-                else:
-                    fingers.append(0)
-        return fingers
+        if not len(myLmList): # 确保关键点不为空
+            return []
+        return finger_up_mask(myLmList, myHand["type"] == "Right").tolist()
 
     def findDistance(self, p1, p2, img=None, color=(255, 0, 255), scale=5):
         x1, y1 = p1
@@ -1,11 +1,48 @@
 import cv2
-from typing import Tuple
+import numpy as np
+from functools import lru_cache
+from typing import Sequence, Tuple
 
 import config
 from hand_utils import HandUtils
 
+
+_FONT = cv2.FONT_HERSHEY_SIMPLEX
+_FPS_FONT_SCALE = 0.7
+_FPS_THICKNESS = 2
+_HUD_MARGIN_TOP = 30     # 手部信息标题基线以上保留的像素
+_HUD_MARGIN_BOTTOM = 10  # 最后一行基线以下保留的像素
+
+# 手部骨架连线，按手指拆成若干折线，一次 polylines 调用即可画完全部 21 条连接
+_HAND_CHAINS = tuple(np.asarray(chain, dtype=np.intp) for chain in (
+    (0, 1, 2, 3, 4),
+    (0, 5, 6, 7, 8),
+    (5, 9, 10, 11, 12),
+    (9, 13, 14, 15, 16),
+    (13, 17, 18, 19, 20),
+    (0, 17),
+))
+
+
+@lru_cache(maxsize=256)
+def _format_label(key: str, value) -> str:
+    """格式化信息行文本，逐帧变化很少的字段直接复用缓存的字符串"""
+    return f'  {key}: {value}'
+
+
+@lru_cache(maxsize=16)
+def _format_hand_title(hand_type: str) -> str:
+    """格式化手部标题文本"""
+    return f'{hand_type} Hand:'
+
+
 class Display:
 
+    # 上一次绘制的FPS文本及其尺寸，文本不变时跳过 getTextSize
+    _fps_cache = {'text': None, 'size': None}
+    # 手部信息文字贴图缓存 {position_offset: (内容键, 包围盒, 颜色分量, 保留系数)}
+    _hud_cache = {}
+
     @staticmethod
     def draw_palm_center(img, palm_center: Tuple[int, int], color: Tuple[int, int, int] = (0, 255, 255)):
         """
@@ -15,11 +52,46 @@ class Display:
             palm_center: 手掌中心坐标
             color: 颜色 (B, G, R)
         """
-        cv2.circle(img, palm_center, 8, color, -1)  # 填充圆
-        cv2.circle(img, palm_center, 12, (0, 0, 0), 2)  # 黑色边框
+        Display.draw_palm_centers(img, (palm_center,), color)
 
     @staticmethod
-    def draw_text_info(img, hand_type: str, info_dict: dict, position_offset: int = 0):
+    def draw_palm_centers(img, palm_centers: Sequence[Tuple[int, int]], color: Tuple[int, int, int] = (0, 255, 255)):
+        """
+        在图像上批量绘制同一帧内所有手的手掌中心（先统一填充，再统一描边）
+        Args:
+            img: 图像
+            palm_centers: 手掌中心坐标序列
+            color: 颜色 (B, G, R)
+        """
+        circle = cv2.circle
+        for center in palm_centers:
+            circle(img, center, 8, color, -1)  # 填充圆
+        for center in palm_centers:
+            circle(img, center, 12, (0, 0, 0), 2)  # 黑色边框
+
+    @staticmethod
+    def draw_landmarks(img, hand):
+        """
+        在图像上绘制单只手的关键点、骨架、包围盒和左右手类型
+        Args:
+            img: 图像
+            hand: 手部数据字典（包含 lmList、bbox、type）
+        """
+        points = hand["lmList"][:, :2]
+        cv2.polylines(img, [points[chain] for chain in _HAND_CHAINS], False,
+                      config.COLORS['landmark_line'], 2)
+        point_color = config.COLORS['landmark_point']
+        for x, y in points.tolist():
+            cv2.circle(img, (x, y), 4, point_color, -1)
+
+        x, y, w, h = hand["bbox"]
+        bbox_color = config.COLORS['landmark_bbox']
+        cv2.rectangle(img, (x - 20, y - 20), (x + w + 20, y + h + 20), bbox_color, 2)
+        cv2.putText(img, hand["type"], (x - 30, y - 30), cv2.FONT_HERSHEY_PLAIN, 2, bbox_color, 2)
+
+    @staticmethod
+    def draw_text_info(img, hand_type: str, info_dict: dict, position_offset: int = 0,
+                       live_keys: Sequence[str] = ()):
         """
         在图像上绘制手部信息
         Args:
@@ -27,20 +99,75 @@ class Display:
             hand_type: 手部类型
             info_dict: 信息字典
             position_offset: Y轴位置偏移
+            live_keys: 几乎每帧都变化的信息项（如坐标），每帧直接 putText，不进入文字贴图缓存
         """
         y_start = 50 + position_offset
         line_height = 20
         
-        # 绘制手部类型
-        cv2.putText(img, f'{hand_type} Hand:', 
-                    (50, y_start), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        
-        # 绘制详细信息
+        # 标题行和很少变化的信息行进入贴图缓存（浮点值按一位小数分桶，使缓存可以命中），
+        # 逐帧变化的信息行单独绘制
+        lines = [(_format_hand_title(hand_type), y_start, 0.7, (255, 255, 255), 2)]
+        live_lines = []
         for i, (key, value) in enumerate(info_dict.items()):
-            y_pos = y_start + (i + 1) * line_height
-            text = f'  {key}: {value}'
-            cv2.putText(img, text, 
-                        (50, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
+            line_y = y_start + (i + 1) * line_height
+            if key in live_keys:
+                live_lines.append((f'  {key}: {value}', line_y))
+                continue
+            if isinstance(value, float):
+                value = round(value, 1)
+            lines.append((_format_label(key, value), line_y, 0.5, (200, 200, 200), 1))
+        
+        # 缓存文字所在的行区域
+        top = max(0, y_start - _HUD_MARGIN_TOP)
+        bottom = min(img.shape[0], lines[-1][1] + _HUD_MARGIN_BOTTOM)
+        if top < bottom:
+            roi = img[top:bottom]
+            
+            # 内容未变化时直接把缓存的文字贴图合成到图像上，省去逐行 putText
+            cache_key = (roi.shape, tuple(line[0] for line in lines))
+            cached = Display._hud_cache.get(position_offset)
+            if cached is None or cached[0] != cache_key:
+                cached = (cache_key, *Display._render_text_stamp(roi.shape, lines, top))
+                Display._hud_cache[position_offset] = cached
+            
+            _, bbox, stamp, keep = cached
+            if bbox is not None:
+                y0, y1, x0, x1 = bbox
+                target = roi[y0:y1, x0:x1]
+                # out = img * (1 - alpha) + color * alpha，keep = 255 * (1 - alpha)
+                target[...] = (target * keep + 127) // 255 + stamp
+        
+        for text, line_y in live_lines:
+            cv2.putText(img, text, (50, line_y), _FONT, 0.5, (200, 200, 200), 1)
+
+    @staticmethod
+    def _render_text_stamp(shape, lines, top):
+        """
+        渲染文字贴图：分别在黑色和白色背景上绘制，得到颜色分量和透明度，
+        兼容抗锯齿字体边缘
+        Args:
+            shape: 区域尺寸
+            lines: [(文本, 基线Y, 字号, 颜色, 粗细)]
+            top: 区域在原图中的起始行
+        Returns:
+            (包围盒, 颜色分量, 保留系数)，无文字像素时包围盒为 None
+        """
+        on_black = np.zeros(shape, dtype=np.uint8)
+        on_white = np.full(shape, 255, dtype=np.uint8)
+        for text, y_pos, scale, color, thickness in lines:
+            for canvas in (on_black, on_white):
+                cv2.putText(canvas, text, (50, y_pos - top), _FONT, scale, color, thickness)
+        
+        keep = on_white.astype(np.uint16) - on_black
+        changed = (keep != 255).reshape(shape[0], shape[1], -1).any(axis=2)
+        rows = np.flatnonzero(changed.any(axis=1))
+        cols = np.flatnonzero(changed.any(axis=0))
+        if not len(rows):
+            return None, None, None
+        y0, y1, x0, x1 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+        return ((y0, y1, x0, x1),
+                on_black[y0:y1, x0:x1].astype(np.uint16),
+                keep[y0:y1, x0:x1])
 
     @staticmethod
     def draw_gesture_message(img, message: str, color: Tuple[int, int, int] = (0, 255, 0)):
@@ -52,7 +179,7 @@ class Display:
             color: 文本颜色
         """
         cv2.putText(img, message, (50, img.shape[0] - 50), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 1, color, 3)
+                    _FONT, 1, color, 3)
 
     @staticmethod
     def draw_fps(img, fps: float, color: Tuple[int, int, int] = (255, 255, 255)):
@@ -64,25 +191,31 @@ class Display:
             color: 文本颜色
         """
         fps_text = f"FPS: {fps:.1f}"
-        text_size = cv2.getTextSize(fps_text, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)[0]
+        cache = Display._fps_cache
+        if cache['text'] != fps_text:
+            cache['text'] = fps_text
+            cache['size'] = cv2.getTextSize(fps_text, _FONT, _FPS_FONT_SCALE, _FPS_THICKNESS)[0]
+        text_size = cache['size']
         x = img.shape[1] - text_size[0] - 10  # 右边距10像素
         y = 30  # 顶部距离30像素
         
         # 绘制背景矩形
         cv2.rectangle(img, (x - 5, y - 20), (x + text_size[0] + 5, y + 5), (0, 0, 0), -1)
         # 绘制FPS文本
-        cv2.putText(img, fps_text, (x, y), cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
+        cv2.putText(img, fps_text, (x, y), _FONT, _FPS_FONT_SCALE, color, _FPS_THICKNESS)
 
     @staticmethod
-    def draw_hand_info(img, hand, hand_index, detector):
-        """绘制手部信息"""
+    def draw_hand_info(img, hand, hand_index, detector) -> Tuple[int, int]:
+        """
+        绘制手部信息
+        Returns:
+            手掌中心坐标，由调用方收集后通过 draw_palm_centers 统一绘制
+        """
         landmarks = hand["lmList"]
         hand_type = hand["type"]
         
-        # 计算并绘制手掌中心
+        # 计算手掌中心
         palm_center = HandUtils.calculate_palm_center(landmarks)
-        if config.DISPLAY_CONFIG['show_palm_center']:
-            Display.draw_palm_center(img, palm_center, config.COLORS['palm_center'])
 
         # 计算手指数量（使用cvzone的方法）
         fingers = detector.fingersUp(hand)
@@ -97,8 +230,10 @@ class Display:
         # 绘制信息
         Display.draw_text_info(
             img, hand_type, info_dict, 
-            position_offset=hand_index * 120
+            position_offset=hand_index * 120, live_keys=('Palm',)
         )
+        
+        return palm_center
 
     @staticmethod
     def draw_gesture_trails(img, trail_points_dict: dict, tracking_active_dict: dict, 
@@ -107,7 +242,7 @@ class Display:
         在图像上绘制手势轨迹（通用版本）
         Args:
             img: 图像
-            trail_points_dict: 轨迹点字典 {hand_id: deque of points}
+            trail_points_dict: 轨迹点字典 {hand_id: TrailBuffer}
             tracking_active_dict: 追踪活跃状态字典 {hand_id: bool}
             trail_color: 轨迹线颜色 (B, G, R)
             center_color: 当前位置圆点颜色 (B, G, R)
@@ -115,19 +250,22 @@ class Display:
         """
         for hand_id, is_active in tracking_active_dict.items():
             if is_active and hand_id in trail_points_dict:
-                trail = list(trail_points_dict[hand_id])
+                trail = trail_points_dict[hand_id].view()  # 零拷贝视图
+                n = len(trail)
                 
-                if len(trail) > 1:
-                    # 绘制轨迹线
-                    for i in range(1, len(trail)):
-                        # 计算透明度（newer points more opaque）
-                        alpha = i / len(trail)
-                        thickness = max(1, int(trail_thickness * alpha))
-                        
-                        cv2.line(img, trail[i-1], trail[i], trail_color, thickness)
+                if n > 1:
+                    # 越新的线段越粗；粗细随下标单调不减，因此同一粗细的线段是连续的一段，
+                    # 每段用一次 polylines 绘制
+                    alphas = np.arange(1, n) / n
+                    thicknesses = np.maximum(1, (trail_thickness * alphas).astype(np.int32))
+                    run_starts = np.flatnonzero(np.diff(thicknesses)) + 1
+                    bounds = [0, *run_starts.tolist(), n - 1]
+                    for start, end in zip(bounds[:-1], bounds[1:]):
+                        # 线段 start..end-1 对应轨迹点 start..end
+                        cv2.polylines(img, [trail[start:end + 1]], False, trail_color, int(thicknesses[start]))
                 
                 # 绘制当前位置
-                if trail:
-                    current_pos = trail[-1]
+                if n:
+                    current_pos = tuple(trail[-1].tolist())
                     cv2.circle(img, current_pos, 8, center_color, -1)
-                    cv2.circle(img, current_pos, 10, trail_color, 2)
\ No newline at end of file
+                    cv2.circle(img, current_pos, 10, trail_color, 2)
@@ -3,7 +3,9 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional
+
+import numpy as np
 
 from gestures.trajectory_tracker import TrajectoryTracker
 
@@ -16,11 +18,11 @@ class GestureDetector(ABC):
         self.history = {}  # 存储每只手的历史数据
     
     @abstractmethod
-    def detect(self, landmarks: List[List[int]], hand_id: str, hand_type: str) -> Optional[Dict[str, Any]]:
+    def detect(self, landmarks: np.ndarray, hand_id: str, hand_type: str) -> Optional[Dict[str, Any]]:
         """
         检测手势
         Args:
-            landmarks: 手部关键点列表
+            landmarks: 手部关键点数组
             hand_id: 手部ID
             hand_type: 手部类型 ("Left" 或 "Right")
         Returns:
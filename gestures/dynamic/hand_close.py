@@ -33,7 +33,7 @@ class HandCloseDetector(TrackerGestureDetector):
         # 抗抖动相关
         self.jitter_counters = {}     # {hand_id: int} - 抖动容忍计数器
     
-    def detect(self, landmarks: List[List[int]], hand_id: str, hand_type: str) -> Optional[Dict[str, Any]]:
+    def detect(self, landmarks: np.ndarray, hand_id: str, hand_type: str) -> Optional[Dict[str, Any]]:
         """检测张开到握拳手势，支持轨迹追踪"""
         # 检查是否在冷却期内
         if self.is_in_cooldown(hand_id):
@@ -154,9 +154,8 @@ class HandCloseDetector(TrackerGestureDetector):
             return False
         
         # 检查所有手指的距离是否都显著减少
-        closing_count = sum(1 for i, dist in enumerate(current_distances) 
-                          if dist < baseline_distances[i] * self.distance_multiplier)
-        return closing_count == 5  # 所有5根手指的距离都必须减少
+        closing = np.asarray(current_distances) < np.asarray(baseline_distances) * self.distance_multiplier
+        return bool(closing.all())  # 所有5根手指的距离都必须减少
     
     def reset(self, hand_id: Optional[str] = None):
         """重置检测器状态"""
@@ -5,6 +5,8 @@
 from collections import deque
 from typing import List, Dict, Any, Optional, Tuple
 
+import numpy as np
+
 from hand_utils import HandUtils
 from ..base import DynamicGestureDetector
 
@@ -17,7 +19,7 @@ class HandFlipDetector(DynamicGestureDetector):
         self.max_movement_percent = config['max_movement_percent']  # 最大移动距离百分比（相对于手掌基准长度）
         self.min_flip_frames = config['min_flip_frames']  # 翻转检测的最小帧数
 
-    def detect(self, landmarks: List[List[int]], hand_id: str, hand_type: str) -> Optional[Dict[str, Any]]:
+    def detect(self, landmarks: np.ndarray, hand_id: str, hand_type: str) -> Optional[Dict[str, Any]]:
         """检测手掌翻转手势"""
         # 检查是否在冷却期内
         if self.is_in_cooldown(hand_id):
@@ -3,7 +3,7 @@
 """
 
 from collections import deque
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional
 
 import numpy as np
 
@@ -19,7 +19,7 @@ class HandOpenDetector(DynamicGestureDetector):
         self.variance_change_percent = config['variance_change_percent']
         self.distance_multiplier = config['distance_multiplier']
     
-    def detect(self, landmarks: List[List[int]], hand_id: str, hand_type: str) -> Optional[Dict[str, Any]]:
+    def detect(self, landmarks: np.ndarray, hand_id: str, hand_type: str) -> Optional[Dict[str, Any]]:
         """检测握拳到张开手势"""
         # 检查是否在冷却期内
         if self.is_in_cooldown(hand_id):
@@ -3,7 +3,9 @@
 """
 
 from collections import deque
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional
+
+import numpy as np
 
 from hand_utils import HandUtils
 from ..base import DynamicGestureDetector
@@ -17,7 +19,7 @@ class HandSwipeDetector(DynamicGestureDetector):
         self.min_distance_percent = config['min_distance_percent']  # 最小移动距离百分比（相对于手掌基准长度）
         self.min_movement_frames = config['min_movement_frames']  # 最小连续移动帧数
 
-    def detect(self, landmarks: List[List[int]], hand_id: str, hand_type: str) -> Optional[Dict[str, Any]]:
+    def detect(self, landmarks: np.ndarray, hand_id: str, hand_type: str) -> Optional[Dict[str, Any]]:
         """检测手左右挥动手势"""
         # 检查是否在冷却期内
         if self.is_in_cooldown(hand_id):
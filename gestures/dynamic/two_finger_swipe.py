@@ -4,7 +4,9 @@
 """
 
 from collections import deque
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional
+
+import numpy as np
 
 from hand_utils import HandUtils
 from ..base import DynamicGestureDetector
@@ -19,7 +21,7 @@ class TwoFingerSwipeDetector(DynamicGestureDetector):
         self.min_movement_frames = config['min_movement_frames']  # 最小连续移动帧数
         self.finger_distance_threshold = config['finger_distance_threshold']  # 食指中指并拢阈值
 
-    def detect(self, landmarks: List[List[int]], hand_id: str, hand_type: str) -> Optional[Dict[str, Any]]:
+    def detect(self, landmarks: np.ndarray, hand_id: str, hand_type: str) -> Optional[Dict[str, Any]]:
         """检测双指滑动手势"""
         # 检查是否在冷却期内
         if self.is_in_cooldown(hand_id):
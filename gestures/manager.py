@@ -2,10 +2,14 @@
 手势管理器 - 统一管理所有手势检测器
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
+
+import numpy as np
 
 import config
+from hand_utils import HandFrame
 from gestures.base import GestureDetector, StaticGestureDetector, TrackerGestureDetector
+from gestures.output import output_gesture_detection
 from gestures.dynamic.hand_open import HandOpenDetector
 from gestures.dynamic.hand_close import HandCloseDetector
 from gestures.dynamic.hand_swipe import HandSwipeDetector
@@ -47,7 +51,17 @@ class GestureManager:
         """移除手势检测器"""
         self.detectors = [d for d in self.detectors if d.name != detector_name]
     
-    def detect_gestures(self, landmarks: List[List[int]], hand_id: str, hand_type: str) -> List[Dict[str, Any]]:
+    def begin_frame(self, landmarks_list: Sequence[np.ndarray]):
+        """
+        开始处理新的一帧：清空上一帧的手部缓存，多手时一次性批量计算各手的手掌特征
+        Args:
+            landmarks_list: 本帧各手的关键点数组列表
+        """
+        HandFrame.reset()
+        if len(landmarks_list) > 1:
+            HandFrame.prime(landmarks_list)
+    
+    def detect_gestures(self, landmarks: np.ndarray, hand_id: str, hand_type: str) -> List[Dict[str, Any]]:
         """
         使用所有检测器检测手势
         Returns:
@@ -55,6 +69,9 @@ class GestureManager:
         """
         results = []
         
+        # 预先构建本帧的手部缓存，各检测器共享手掌中心、基准长度等中间结果
+        HandFrame.of(landmarks)
+        
         # 先检测静态手势
         for detector in self.detectors:
             if isinstance(detector, StaticGestureDetector):
@@ -69,7 +86,6 @@ class GestureManager:
                         results.append(result)
                         
                         # 直接发送手势检测结果
-                        from gestures.output import output_gesture_detection
                         output_gesture_detection(result, hand_id)
 
                 except Exception as e:
@@ -85,7 +101,6 @@ class GestureManager:
                         results.append(result)
                         
                         # 直接发送手势检测结果
-                        from gestures.output import output_gesture_detection
                         output_gesture_detection(result, hand_id)
                 except Exception as e:
                     print(f"动态手势检测器 {detector.name} 出错: {e}")
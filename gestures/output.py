@@ -3,13 +3,71 @@
 支持命令行打印和Socket网络发送
 """
 
+import atexit
 import json
+import math
+import queue
+import threading
 import time
 from typing import Dict, Any
 
 import config
 from connect.socket_client import send_message
 
+# 热路径上频繁调用的函数预先绑定为模块级名称，省去逐次的属性查找
+_json_dumps = json.dumps
+_time_time = time.time
+_sqrt = math.sqrt
+
+# 命令行输出队列：检测线程只负责入队，由后台线程执行 print，终端阻塞不会拖慢帧处理
+_CONSOLE_QUEUE_SIZE = 256
+_console_queue = queue.Queue(maxsize=_CONSOLE_QUEUE_SIZE)
+_console_thread = None
+_console_thread_lock = threading.Lock()
+
+
+def _console_worker():
+    """后台输出线程：逐条取出并打印"""
+    while True:
+        line = _console_queue.get()
+        print(line)
+
+
+def _flush_console_queue():
+    """程序退出时打印队列中剩余的消息"""
+    while True:
+        try:
+            print(_console_queue.get_nowait())
+        except queue.Empty:
+            break
+
+
+def _console_print(line: str):
+    """
+    异步打印一行输出，队列满时丢弃最旧的消息
+    Args:
+        line: 要打印的文本
+    """
+    global _console_thread
+    if _console_thread is None:
+        with _console_thread_lock:
+            if _console_thread is None:
+                _console_thread = threading.Thread(target=_console_worker, name="gesture-console", daemon=True)
+                _console_thread.start()
+                atexit.register(_flush_console_queue)
+    
+    try:
+        _console_queue.put_nowait(line)
+    except queue.Full:
+        try:
+            _console_queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            _console_queue.put_nowait(line)
+        except queue.Full:
+            pass
+
 
 class GestureOutputManager:
     """手势输出管理器"""
@@ -47,9 +105,9 @@ class GestureOutputManager:
         message = self._create_gesture_message(gesture_info, self.console_format)
         if self.enable_console_output:
             if gesture_info['type'] == 'trail_change':
-                print(f"[TRAIL_UPDATE] {message}")
+                _console_print(f"[TRAIL_UPDATE] {message}")
             else:
-                print(f"[GESTURE_DETECTED] {message}")
+                _console_print(f"[GESTURE_DETECTED] {message}")
 
         if self.enable_socket_output:
             try:
@@ -64,11 +122,21 @@ class GestureOutputManager:
                 send_message(message, host=config.SOCKET_HOST, port=config.SOCKET_PORT)
             except Exception as e:
                 if self.enable_console_output:
-                    print(f"[GESTURE_OUTPUT] Socket发送失败: {e}")
+                    _console_print(f"[GESTURE_OUTPUT] Socket发送失败: {e}")
 
     def output_trail_change_with_threshold(self, gesture: str, hand_id: str, current_pos: tuple, hand_type: str,
                                          last_output_positions: dict, output_frame_counters: dict,
                                          output_interval_frames: int, movement_threshold: float) -> bool:
+        """输出轨迹变化（带间隔和移动阈值控制），距离比较使用平方，仅在输出时开方"""
+        return self.output_trail_change_with_threshold_sq(
+            gesture, hand_id, current_pos, hand_type, last_output_positions, output_frame_counters,
+            output_interval_frames, movement_threshold * movement_threshold
+        )
+
+    def output_trail_change_with_threshold_sq(self, gesture: str, hand_id: str, current_pos: tuple, hand_type: str,
+                                            last_output_positions: dict, output_frame_counters: dict,
+                                            output_interval_frames: int, movement_threshold_sq: float) -> bool:
+        """与 output_trail_change_with_threshold 相同，但阈值为移动距离的平方，仅在真正输出时开方"""
         # 检查输出间隔
         output_frame_counters[hand_id] = output_frame_counters.get(hand_id, 0) + 1
         if output_frame_counters[hand_id] < output_interval_frames:
@@ -79,45 +147,43 @@ class GestureOutputManager:
         
         last_pos = last_output_positions.get(hand_id)
         
-        if last_pos is not None:
-            # 计算移动距离
-            dx = current_pos[0] - last_pos[0]
-            dy = current_pos[1] - last_pos[1]
-            distance = (dx**2 + dy**2)**0.5
-            
-            # 检查是否超过移动阈值
-            if distance >= movement_threshold:
-                # 创建轨迹信息对象
-                trail_info = {
-                    'hand_id': hand_id,
-                    'hand_type': hand_type,
-                    'confidence': 100,
-                    'gesture': gesture,
-                    'position': current_pos,
-                    'movement_data': {
-                        'movement': {
-                            'dx': dx,
-                            'dy': dy,
-                            'distance': round(distance, 2)
-                        },
-                        'previous_position': {
-                            'x': last_pos[0],
-                            'y': last_pos[1]
-                        }
-                    },
-                    'type': 'trail_change'
-                }
-
-                self.output_gesture_detection(trail_info, hand_id)
-                
-                # 更新上次输出位置
-                last_output_positions[hand_id] = current_pos
-                return True
-        else:
+        if last_pos is None:
             # 第一次输出，记录位置但不输出
             last_output_positions[hand_id] = current_pos
+            return False
+        
+        # 使用距离平方与阈值平方比较
+        dx = current_pos[0] - last_pos[0]
+        dy = current_pos[1] - last_pos[1]
+        distance_sq = dx * dx + dy * dy
+        if distance_sq < movement_threshold_sq:
+            return False
+        
+        trail_info = {
+            'hand_id': hand_id,
+            'hand_type': hand_type,
+            'confidence': 100,
+            'gesture': gesture,
+            'position': current_pos,
+            'movement_data': {
+                'movement': {
+                    'dx': dx,
+                    'dy': dy,
+                    'distance': round(_sqrt(distance_sq), 2)
+                },
+                'previous_position': {
+                    'x': last_pos[0],
+                    'y': last_pos[1]
+                }
+            },
+            'type': 'trail_change'
+        }
+        
+        self.output_gesture_detection(trail_info, hand_id)
         
-        return False
+        # 更新上次输出位置
+        last_output_positions[hand_id] = current_pos
+        return True
 
     def _create_gesture_message(self, gesture_info: Dict[str, Any], format_type: str) -> str:
         """创建手势检测消息（统一格式）"""
@@ -133,14 +199,14 @@ class GestureOutputManager:
                 # 添加位置信息
                 details.update({'position': {'x': gesture_info['position'][0], 'y': gesture_info['position'][1]}})
             output_data = {
-                'timestamp': time.time(),
+                'timestamp': _time_time(),
                 'hand_type': gesture_info['hand_type'].lower(),
                 'confidence': gesture_info['confidence'],
                 'gesture': gesture_info['gesture'],
                 'details': details if details else gesture_info['details'],
                 'type': gesture_info['type'],
             }
-            return json.dumps(output_data, ensure_ascii=False)
+            return _json_dumps(output_data, ensure_ascii=False)
         else:
             if gesture_info['type'] == 'trail_change':
                 position = gesture_info['position']
@@ -176,3 +242,13 @@ def output_trail_change_with_threshold(gesture: str, hand_id: str, current_pos:
         gesture, hand_id, current_pos, hand_type, last_output_positions, output_frame_counters,
         output_interval_frames, movement_threshold
     )
+
+
+def output_trail_change_with_threshold_sq(gesture: str, hand_id: str, current_pos: tuple, hand_type: str,
+                                        last_output_positions: dict, output_frame_counters: dict,
+                                        output_interval_frames: int, movement_threshold_sq: float) -> bool:
+    """便捷函数：输出轨迹变化（阈值为移动距离的平方）"""
+    return get_output_manager().output_trail_change_with_threshold_sq(
+        gesture, hand_id, current_pos, hand_type, last_output_positions, output_frame_counters,
+        output_interval_frames, movement_threshold_sq
+    )
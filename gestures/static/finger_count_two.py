@@ -2,7 +2,9 @@
 数字二手势检测器 - 静态手势
 """
 
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional
+
+import numpy as np
 
 from hand_utils import HandUtils
 from ..base import StaticGestureDetector
@@ -15,7 +17,7 @@ class FingerCountTwoDetector(StaticGestureDetector):
         super().__init__("FingerCountTwo", config['required_frames'], config['debounce_frames'])
         self.distance_threshold_percent = config['distance_threshold_percent']
 
-    def detect(self, landmarks: List[List[int]], hand_id: str, hand_type: str) -> Optional[Dict[str, Any]]:
+    def detect(self, landmarks: np.ndarray, hand_id: str, hand_type: str) -> Optional[Dict[str, Any]]:
         """检测数字二手势 - 食指和中指伸出且朝上"""
         
         # 1. 检查食指和中指是否伸直且朝上 - 使用HandUtils的通用方法
@@ -51,7 +53,7 @@ class FingerCountTwoDetector(StaticGestureDetector):
         
         return None
     
-    def _calculate_confidence(self, landmarks: List[List[int]]) -> float:
+    def _calculate_confidence(self, landmarks: np.ndarray) -> float:
         """计算手势置信度"""
         base_confidence = 85
         
@@ -4,6 +4,8 @@
 
 from typing import List, Dict, Any, Optional
 
+import numpy as np
+
 from hand_utils import HandUtils
 from ..base import StaticGestureDetector
 
@@ -16,7 +18,7 @@ class ThumbsDetector(StaticGestureDetector):
         self.type = type  # 手势类型
         self.config = config
 
-    def detect(self, landmarks: List[List[int]], hand_id: str, hand_type: str) -> Optional[Dict[str, Any]]:
+    def detect(self, landmarks: np.ndarray, hand_id: str, hand_type: str) -> Optional[Dict[str, Any]]:
         """检测竖大拇指手势 - 使用HandUtils的通用方法"""
         # 获取关键点
         thumb_tip, thumb_ip, thumb_mcp = landmarks[4], landmarks[3], landmarks[2]
@@ -32,7 +34,7 @@ class ThumbsDetector(StaticGestureDetector):
         thumb_angle_good = thumb_angle < self.config['thumb_angle_threshold']
         
         # 2. 检查大拇指指尖是否离掌心足够远（百分比判断）
-        thumb_distance = HandUtils.calculate_distance(thumb_tip, list(palm_center))
+        thumb_distance = HandUtils.calculate_distance(thumb_tip, palm_center)
         thumb_distance_ratio = thumb_distance / palm_base_length if palm_base_length > 0 else 0
         thumb_extended = thumb_distance_ratio > self.config['thumb_distance_threshold']
         
@@ -49,7 +51,7 @@ class ThumbsDetector(StaticGestureDetector):
         
         for tip_idx, pip_idx, mcp_idx, name in fingers_data:
             # 检查手指尖是否贴近掌心（百分比判断）
-            tip_distance = HandUtils.calculate_distance(landmarks[tip_idx], list(palm_center))
+            tip_distance = HandUtils.calculate_distance(landmarks[tip_idx], palm_center)
             tip_distance_ratio = tip_distance / palm_base_length if palm_base_length > 0 else 0
             is_close_to_palm = tip_distance_ratio < self.config['other_fingers_threshold']
 
@@ -2,10 +2,159 @@
 通用轨迹追踪模块 - 支持多种手势的轨迹追踪和平滑
 """
 
+import math
+import time
 from collections import deque
-from typing import Dict, Any, Optional, Tuple
+from typing import Callable, Dict, Any, Optional, Tuple
 
-from gestures.output import output_trail_change_with_threshold
+import numpy as np
+
+from gestures.output import output_trail_change_with_threshold_sq
+
+
+class OneEuroFilter:
+    """
+    One-Euro 自适应低通滤波器
+    根据移动速度动态调整截止频率：静止时强平滑抑制抖动，快速移动时弱平滑减少延迟
+    """
+    
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 0.01, d_cutoff: float = 1.0, frequency: float = 30.0):
+        """
+        初始化滤波器
+        Args:
+            min_cutoff: 最小截止频率（Hz），越小静止时越平滑
+            beta: 速度系数，越大快速移动时延迟越小
+            d_cutoff: 速度估计的截止频率（Hz）
+            frequency: 默认采样频率（Hz），无法从时间戳得到采样周期时使用
+        """
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.frequency = frequency
+        self.reset()
+    
+    def reset(self):
+        """重置滤波器状态"""
+        self._prev_pos = None          # 上一次滤波后的位置 (x, y)
+        self._prev_dpos = (0.0, 0.0)   # 上一次滤波后的速度 (dx, dy)
+        self._prev_time = None
+    
+    @staticmethod
+    def _alpha(cutoff: float, te: float) -> float:
+        """根据截止频率和采样周期计算低通滤波系数"""
+        return 1.0 / (1.0 + 1.0 / (2 * math.pi * cutoff * te))
+    
+    def filter(self, position: Tuple[float, float], timestamp: Optional[float] = None) -> Tuple[float, float]:
+        """
+        对新位置进行滤波
+        Args:
+            position: 新位置 (x, y)
+            timestamp: 采样时间（秒），默认使用当前单调时间
+        Returns:
+            滤波后的位置 (x, y)
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        
+        # 第一个位置直接作为初始状态
+        if self._prev_pos is None:
+            self._prev_pos = (float(position[0]), float(position[1]))
+            self._prev_time = timestamp
+            return self._prev_pos
+        
+        # 采样周期
+        te = timestamp - self._prev_time
+        if te <= 0:
+            te = 1.0 / self.frequency
+        self._prev_time = timestamp
+        
+        prev_x, prev_y = self._prev_pos
+        prev_dx, prev_dy = self._prev_dpos
+        
+        # 估计速度并进行低通滤波
+        alpha_d = self._alpha(self.d_cutoff, te)
+        dx_hat = alpha_d * (position[0] - prev_x) / te + (1 - alpha_d) * prev_dx
+        dy_hat = alpha_d * (position[1] - prev_y) / te + (1 - alpha_d) * prev_dy
+        self._prev_dpos = (dx_hat, dy_hat)
+        
+        # 根据速度调整截止频率，再对位置进行低通滤波
+        cutoff = self.min_cutoff + self.beta * math.hypot(dx_hat, dy_hat)
+        alpha = self._alpha(cutoff, te)
+        filtered_x = alpha * position[0] + (1 - alpha) * prev_x
+        filtered_y = alpha * position[1] + (1 - alpha) * prev_y
+        self._prev_pos = (filtered_x, filtered_y)
+        
+        return self._prev_pos
+
+
+class TrailBuffer:
+    """
+    轨迹点环形缓冲区
+    预分配 int32 数组，新点直接写入数组行，避免逐帧创建并在 deque 中保存元组；
+    每个点同时写入 i 和 i + capacity 两处（镜像存储），因此任意时刻按时间顺序的轨迹
+    都是数组中连续的一段，可通过 view() 零拷贝获取。
+    接口与 deque(maxlen=capacity) 的常用部分兼容（append/clear/len/迭代/下标）
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        初始化缓冲区
+        Args:
+            capacity: 最大轨迹点数
+        """
+        self.capacity = capacity
+        self._data = np.zeros((2 * capacity, 2), dtype=np.int32)
+        self._head = 0   # 下一个写入位置（0 ~ capacity-1）
+        self._size = 0
+    
+    def append(self, point: Tuple[int, int]):
+        """添加轨迹点，缓冲区满时覆盖最旧的点"""
+        head = self._head
+        self._data[head] = point
+        self._data[head + self.capacity] = point
+        self._head = head + 1 if head + 1 < self.capacity else 0
+        if self._size < self.capacity:
+            self._size += 1
+    
+    def clear(self):
+        """清空轨迹"""
+        self._head = 0
+        self._size = 0
+    
+    def view(self) -> np.ndarray:
+        """
+        按时间顺序返回轨迹点的只读视图（不复制，下一次 append 后内容可能改变）
+        Returns:
+            轨迹点数组视图 (N, 2)
+        """
+        start = self._head - self._size
+        if start < 0:
+            start += self.capacity
+        view = self._data[start:start + self._size]
+        view.flags.writeable = False
+        return view
+    
+    def to_array(self) -> np.ndarray:
+        """
+        按时间顺序返回轨迹点
+        Returns:
+            轨迹点数组 (N, 2) 的副本
+        """
+        return self.view().copy()
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __iter__(self):
+        return iter([tuple(point) for point in self.view().tolist()])
+    
+    def __getitem__(self, index: int) -> Tuple[int, int]:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("轨迹点索引超出范围")
+        x, y = self.view()[index].tolist()
+        return (x, y)
 
 
 class TrajectoryTracker:
@@ -20,31 +169,44 @@ class TrajectoryTracker:
         """
         self.tracking_config = tracking_config
         self.smoothing_config = smoothing_config
+        self.enable_tracking = tracking_config.get('enable_tracking', True)
+        self.movement_threshold_sq = tracking_config['movement_threshold'] ** 2  # 移动阈值平方，避免逐帧开方
         
         # 轨迹存储
-        self.trail_points = {}  # {hand_id: deque of points}
+        self.trail_points = {}  # {hand_id: TrailBuffer} - 轨迹点环形缓冲区
         self.tracking_active = {}  # {hand_id: bool} - 追踪每只手的活动状态
         self.debounce_counters = {}  # {hand_id: int} - 去抖计数器
         self.gesture_triggered = {}  # {hand_id: bool} - 手势是否已被触发
         
         # 轨迹平滑相关
-        self.smoothed_positions = {}  # {hand_id: (x, y)} - 平滑后的位置
+        self.smoothed_positions = {}  # {hand_id: (x, y)} - 平滑后的位置（浮点）
         self.position_history = {}    # {hand_id: deque} - 位置历史用于窗口平滑
+        self.filter_type = smoothing_config.get('filter_type', 'one_euro')  # 'one_euro' 或 'ema'
+        self.one_euro_filters = {}    # {hand_id: OneEuroFilter} - One-Euro滤波器状态
         
         # 命令行输出相关
         self.last_output_positions = {}  # {hand_id: (x, y)} - 上次输出的位置
         self.output_frame_counters = {}  # {hand_id: int} - 输出帧计数器
+        
+        # 按配置绑定的平滑函数
+        self._smooth = self._make_smoother()
     
     def initialize_hand_tracking(self, hand_id: str):
         """初始化手部追踪状态"""
         if hand_id not in self.trail_points:
-            self.trail_points[hand_id] = deque(maxlen=self.tracking_config['max_trail_points'])
+            self.trail_points[hand_id] = TrailBuffer(self.tracking_config['max_trail_points'])
             self.tracking_active[hand_id] = False
             self.debounce_counters[hand_id] = 0
             self.gesture_triggered[hand_id] = False
             # 初始化轨迹平滑相关
             self.smoothed_positions[hand_id] = None
             self.position_history[hand_id] = deque(maxlen=self.smoothing_config.get('smoothing_window', 5))
+            self.one_euro_filters[hand_id] = OneEuroFilter(
+                min_cutoff=self.smoothing_config.get('min_cutoff', 1.0),
+                beta=self.smoothing_config.get('beta', 0.01),
+                d_cutoff=self.smoothing_config.get('d_cutoff', 1.0),
+                frequency=self.smoothing_config.get('frequency', 30.0)
+            )
             # 初始化命令行输出相关
             self.last_output_positions[hand_id] = None
             self.output_frame_counters[hand_id] = 0
@@ -67,11 +229,8 @@ class TrajectoryTracker:
         Returns:
             轨迹结束信息（如果有）
         """
-        if not self.tracking_config.get('enable_tracking', True):
-            return None
-        
-        # 只有手势被触发后才开始追踪
-        if not self.gesture_triggered.get(hand_id, False):
+        # 未启用追踪或手势未被触发时直接返回（无手势时的常见路径）
+        if not self.enable_tracking or not self.gesture_triggered.get(hand_id):
             return None
         
         was_active = self.tracking_active.get(hand_id, False)
@@ -87,17 +246,17 @@ class TrajectoryTracker:
                 print(f"[TRACKING] 开始显示 {hand_id} 的轨迹")
             
             # 应用轨迹平滑
-            smoothed_position = self._apply_trajectory_smoothing(hand_id, position)
+            smoothed_position = self._smooth(hand_id, position)
             
             # 添加平滑后的位置到轨迹
             self.trail_points[hand_id].append(smoothed_position)
             self.debounce_counters[hand_id] = 0
             
             # 输出轨迹变化，使用统一的输出管理器
-            output_trail_change_with_threshold(
+            output_trail_change_with_threshold_sq(
                 gesture, hand_id, smoothed_position, hand_type,
                 self.last_output_positions, self.output_frame_counters,
-                self.tracking_config['output_interval_frames'], self.tracking_config['movement_threshold'],
+                self.tracking_config['output_interval_frames'], self.movement_threshold_sq,
             )
             
         else:
@@ -121,32 +280,51 @@ class TrajectoryTracker:
         
         return None
     
-    def _apply_trajectory_smoothing(self, hand_id: str, new_position: Tuple[int, int]) -> Tuple[int, int]:
-        """应用轨迹平滑算法"""
+    def _make_smoother(self) -> Callable[[str, Tuple[int, int]], Tuple[int, int]]:
+        """
+        根据平滑配置生成专用的平滑函数，避免每帧重复判断配置
+        Returns:
+            平滑函数 (hand_id, position) -> 平滑后的整数位置
+        """
         if not self.smoothing_config.get('enable_smoothing', True):
-            return new_position
+            return lambda hand_id, position: position
         
-        # 添加新位置到历史记录
-        self.position_history[hand_id].append(new_position)
+        position_history = self.position_history
+        smoothed_positions = self.smoothed_positions
         
-        # 如果这是第一个位置，直接返回
-        if self.smoothed_positions[hand_id] is None:
-            self.smoothed_positions[hand_id] = new_position
-            return new_position
+        if self.filter_type == 'ema':
+            # 固定系数的指数滑动平均平滑（兼容旧配置），系数在此绑定
+            weight = self.smoothing_config.get('smoothing_weight', 0.3)
+            keep = 1 - weight
+            
+            def ema_step(hand_id: str, new_position: Tuple[int, int]) -> Tuple[int, int]:
+                position_history[hand_id].append(new_position)
+                prev = smoothed_positions[hand_id]
+                
+                # 如果这是第一个位置，直接返回
+                if prev is None:
+                    smoothed_positions[hand_id] = (float(new_position[0]), float(new_position[1]))
+                    return new_position
+                
+                # 应用加权平均，状态保持浮点，避免慢速移动时取整导致滤波停滞
+                smoothed_x = prev[0] * keep + new_position[0] * weight
+                smoothed_y = prev[1] * keep + new_position[1] * weight
+                smoothed_positions[hand_id] = (smoothed_x, smoothed_y)
+                return (int(round(smoothed_x)), int(round(smoothed_y)))
+            
+            return ema_step
         
-        # 使用低通滤波器进行平滑
-        prev_x, prev_y = self.smoothed_positions[hand_id]
-        new_x, new_y = new_position
+        one_euro_filters = self.one_euro_filters
         
-        # 应用加权平均
-        smoothing_weight = self.smoothing_config.get('smoothing_weight', 0.3)
-        smoothed_x = int(prev_x * (1 - smoothing_weight) + new_x * smoothing_weight)
-        smoothed_y = int(prev_y * (1 - smoothing_weight) + new_y * smoothing_weight)
-
-        smoothed_position = (smoothed_x, smoothed_y)
-        self.smoothed_positions[hand_id] = smoothed_position
+        def one_euro_step(hand_id: str, new_position: Tuple[int, int]) -> Tuple[int, int]:
+            position_history[hand_id].append(new_position)
+            
+            # 使用One-Euro自适应滤波器进行平滑（内部状态保持浮点，仅输出时取整）
+            smoothed = one_euro_filters[hand_id].filter(new_position)
+            smoothed_positions[hand_id] = smoothed
+            return (int(round(smoothed[0])), int(round(smoothed[1])))
         
-        return smoothed_position
+        return one_euro_step
     
     def _reset_smoothing_state(self, hand_id: str):
         """重置轨迹平滑状态"""
@@ -154,6 +332,8 @@ class TrajectoryTracker:
             self.smoothed_positions[hand_id] = None
         if hand_id in self.position_history:
             self.position_history[hand_id].clear()
+        if hand_id in self.one_euro_filters:
+            self.one_euro_filters[hand_id].reset()
     
     def _reset_console_output(self, hand_id: str):
         """重置命令行输出相关状态"""
@@ -183,16 +363,22 @@ class TrajectoryTracker:
         # 清空轨迹平滑相关
         self.smoothed_positions.clear()
         self.position_history.clear()
+        self.one_euro_filters.clear()
         # 清空命令行输出相关
         self.last_output_positions.clear()
         self.output_frame_counters.clear()
     
     def get_tracking_status(self) -> Dict[str, Dict]:
-        """获取所有手的追踪状态"""
+        """
+        获取所有手的追踪状态
+        Returns:
+            {hand_id: 状态字典}，其中 'trail_points' 为内部轨迹缓冲区的只读视图，
+            调用方如需修改或跨帧保存请使用 get_trail_snapshot
+        """
         return {
             hand_id: {
                 'active': self.tracking_active.get(hand_id, False),
-                'trail_points': list(self.trail_points.get(hand_id, [])),
+                'trail_points': self.trail_points.get(hand_id),
                 'debounce_counter': self.debounce_counters.get(hand_id, 0),
                 'gesture_triggered': self.gesture_triggered.get(hand_id, False),
                 'smoothed_position': self.smoothed_positions.get(hand_id),
@@ -201,6 +387,19 @@ class TrajectoryTracker:
             for hand_id in self.trail_points.keys()
         }
     
+    def get_trail_snapshot(self, hand_id: str) -> np.ndarray:
+        """
+        获取指定手部轨迹的独立副本
+        Args:
+            hand_id: 手部ID
+        Returns:
+            轨迹点数组 (N, 2)，无轨迹时为空数组
+        """
+        points = self.trail_points.get(hand_id)
+        if points is None:
+            return np.empty((0, 2), dtype=np.int32)
+        return points.to_array()
+    
     def get_trail_data_for_drawing(self):
         """获取用于绘制的轨迹数据"""
         return {
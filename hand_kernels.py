@@ -0,0 +1,318 @@
+"""
+手部计算内核 - 热点数值计算的 Numba 加速实现
+未安装 numba 时自动退化为普通 Python/NumPy 实现，行为一致
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """numba 不可用时的占位装饰器，直接返回原函数"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# 指尖两两组合的上三角索引（5 个指尖共 10 对）
+_PAIR_I, _PAIR_J = np.triu_indices(5, 1)
+
+
+@njit(cache=True, fastmath=True)
+def _fingertip_variance_jit(points: np.ndarray) -> float:
+    """指尖两两距离方差的 Numba 循环实现"""
+    n = points.shape[0]
+    distances = np.empty(n * (n - 1) // 2, dtype=np.float64)
+    k = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            dx = float(points[i, 0] - points[j, 0])
+            dy = float(points[i, 1] - points[j, 1])
+            distances[k] = math.sqrt(dx * dx + dy * dy)
+            k += 1
+    return distances.var()
+
+
+def _fingertip_variance_numpy(points: np.ndarray) -> float:
+    """指尖两两距离方差的 NumPy 广播实现（无 numba 时使用，避免逐对的解释器循环）"""
+    tips = points.astype(np.float64)
+    diff = tips[:, None, :] - tips[None, :, :]
+    d2 = (diff * diff).sum(axis=-1)
+    return float(np.sqrt(d2[_PAIR_I, _PAIR_J]).var())
+
+
+def fingertip_variance(points: np.ndarray) -> float:
+    """
+    计算指尖两两距离的方差
+    Args:
+        points: 指尖坐标数组 (5, 2)
+    Returns:
+        两两距离的方差
+    """
+    if NUMBA_AVAILABLE:
+        return _fingertip_variance_jit(points)
+    return _fingertip_variance_numpy(points)
+
+
+@njit(cache=True)
+def _finger_extended_jit(lm: np.ndarray, tip: int, pip: int, mcp: int,
+                    palm_base_sq: float, distance_threshold_percent: float) -> bool:
+    """
+    判断手指是否伸直且朝上（距离平方比较）
+    Args:
+        lm: 关键点数组 (21, 3)
+        tip: 指尖索引
+        pip: PIP 关节索引
+        mcp: MCP 关节索引
+        palm_base_sq: 手掌基准长度的平方
+        distance_threshold_percent: 距离阈值百分比
+    Returns:
+        手指是否伸直且朝上
+    """
+    dx = lm[tip, 0] - lm[0, 0]
+    dy = lm[tip, 1] - lm[0, 1]
+    ratio_sq = distance_threshold_percent * distance_threshold_percent
+    extended = dx * dx + dy * dy > palm_base_sq * ratio_sq
+    upward = lm[tip, 1] < lm[pip, 1] and lm[pip, 1] < lm[mcp, 1]
+    return extended and upward
+
+
+@njit(cache=True)
+def _finger_bent_jit(lm: np.ndarray, tip: int, pip: int) -> bool:
+    """
+    判断手指是否弯曲（指尖到手腕的距离小于 PIP 到手腕距离的 0.9 倍，使用距离平方比较）
+    Args:
+        lm: 关键点数组 (21, 3)
+        tip: 指尖索引
+        pip: PIP 关节索引
+    Returns:
+        手指是否弯曲
+    """
+    tx = float(lm[tip, 0] - lm[0, 0])
+    ty = float(lm[tip, 1] - lm[0, 1])
+    px = float(lm[pip, 0] - lm[0, 0])
+    py = float(lm[pip, 1] - lm[0, 1])
+    return tx * tx + ty * ty < (px * px + py * py) * 0.81
+
+
+@njit(cache=True)
+def _hand_upward_jit(lm: np.ndarray) -> bool:
+    """
+    判断五个指尖是否都在手腕上方
+    Args:
+        lm: 关键点数组 (21, 3)
+    Returns:
+        手是否向上
+    """
+    wrist_y = lm[0, 1]
+    for tip in (4, 8, 12, 16, 20):
+        if lm[tip, 1] >= wrist_y:
+            return False
+    return True
+
+
+@njit(cache=True)
+def _two_finger_pose_jit(lm: np.ndarray, palm_base_sq: float, palm_center_x: int, palm_center_y: int,
+                    palm_base_length: float, finger_distance_threshold: float) -> bool:
+    """
+    判断是否为双指姿态（食指和中指并拢朝上，无名指和小指弯曲，拇指靠近掌心）
+    Args:
+        lm: 关键点数组 (21, 3)
+        palm_base_sq: 手掌基准长度的平方（本帧计算值）
+        palm_center_x: 手掌中心 X
+        palm_center_y: 手掌中心 Y
+        palm_base_length: 用于并拢判断的手掌基准长度
+        finger_distance_threshold: 食指中指并拢的距离阈值（相对于手掌基准长度）
+    Returns:
+        是否为双指姿态
+    """
+    # 按开销从低到高依次判断，多数非双指帧在前几步即可返回
+    # 1. 食指和中指并拢
+    close_distance = palm_base_length * finger_distance_threshold
+    if close_distance <= 0:
+        return False
+    fx = float(lm[8, 0] - lm[12, 0])
+    fy = float(lm[8, 1] - lm[12, 1])
+    if not fx * fx + fy * fy < close_distance * close_distance:
+        return False
+    
+    # 2. 无名指和小指弯曲
+    if not _finger_bent_jit(lm, 16, 14) or not _finger_bent_jit(lm, 20, 18):
+        return False
+    
+    # 3. 食指和中指伸直且朝上
+    if not _finger_extended_jit(lm, 8, 6, 5, palm_base_sq, 0.6):
+        return False
+    if not _finger_extended_jit(lm, 12, 10, 9, palm_base_sq, 0.6):
+        return False
+    
+    # 4. 拇指靠近掌心（距离 < 0.5 * 手掌基准长度，两边平方）
+    if palm_base_sq <= 0:
+        return False
+    tx = float(lm[4, 0] - palm_center_x)
+    ty = float(lm[4, 1] - palm_center_y)
+    return tx * tx + ty * ty < palm_base_sq * 0.25
+
+
+@njit(cache=True)
+def _finger_up_mask_jit(lm: np.ndarray, is_right: bool) -> np.ndarray:
+    """
+    判断五根手指是否竖起（与 cvzone 的 fingersUp 规则一致）
+    Args:
+        lm: 关键点数组 (21, 3)
+        is_right: 是否为右手（决定拇指的判断方向）
+    Returns:
+        (5,) uint8 数组，1 表示该手指竖起
+    """
+    mask = np.zeros(5, dtype=np.uint8)
+    # 拇指：比较指尖与 IP 关节的 X 坐标
+    if is_right:
+        mask[0] = lm[4, 0] > lm[3, 0]
+    else:
+        mask[0] = lm[4, 0] < lm[3, 0]
+    # 其余四指：指尖高于 PIP 关节
+    for k in range(1, 5):
+        tip = 4 * k + 4
+        mask[k] = lm[tip, 1] < lm[tip - 2, 1]
+    return mask
+
+
+@njit(cache=True)
+def bbox_iou(x1: int, y1: int, w1: int, h1: int, x2: int, y2: int, w2: int, h2: int) -> float:
+    """
+    计算两个 (x, y, w, h) 包围盒的交并比
+    Returns:
+        IoU 值，范围 0-1
+    """
+    inter_w = min(x1 + w1, x2 + w2) - max(x1, x2)
+    inter_h = min(y1 + h1, y2 + h2) - max(y1, y2)
+    if inter_w <= 0 or inter_h <= 0:
+        return 0.0
+    inter = inter_w * inter_h
+    union = w1 * h1 + w2 * h2 - inter
+    if union <= 0:
+        return 0.0
+    return inter / union
+
+
+# ---- 无 numba 时的纯 Python 实现 ----
+# 未编译时逐个索引 numpy 标量很慢，这里先用一次 tolist() 转成嵌套列表，之后全部是 Python int 运算
+
+
+def _rows(lm):
+    """关键点转为嵌套列表（已是列表时原样返回）"""
+    return lm if isinstance(lm, list) else lm.tolist()
+
+
+def _finger_extended_py(lm, tip: int, pip: int, mcp: int,
+                        palm_base_sq: float, distance_threshold_percent: float) -> bool:
+    """finger_extended 的纯 Python 实现"""
+    lm = _rows(lm)
+    wrist_x, wrist_y = lm[0][0], lm[0][1]
+    tip_x, tip_y = lm[tip][0], lm[tip][1]
+    dx = tip_x - wrist_x
+    dy = tip_y - wrist_y
+    ratio_sq = distance_threshold_percent * distance_threshold_percent
+    extended = dx * dx + dy * dy > palm_base_sq * ratio_sq
+    pip_y = lm[pip][1]
+    return extended and tip_y < pip_y < lm[mcp][1]
+
+
+def _finger_bent_py(lm, tip: int, pip: int) -> bool:
+    """finger_bent 的纯 Python 实现"""
+    lm = _rows(lm)
+    wrist_x, wrist_y = lm[0][0], lm[0][1]
+    tx = lm[tip][0] - wrist_x
+    ty = lm[tip][1] - wrist_y
+    px = lm[pip][0] - wrist_x
+    py = lm[pip][1] - wrist_y
+    return tx * tx + ty * ty < (px * px + py * py) * 0.81
+
+
+def _hand_upward_py(lm) -> bool:
+    """hand_upward 的纯 Python 实现"""
+    lm = _rows(lm)
+    wrist_y = lm[0][1]
+    return all(lm[tip][1] < wrist_y for tip in (4, 8, 12, 16, 20))
+
+
+def _two_finger_pose_py(lm, palm_base_sq: float, palm_center_x: int, palm_center_y: int,
+                        palm_base_length: float, finger_distance_threshold: float) -> bool:
+    """two_finger_pose 的纯 Python 实现（判断顺序与编译版本相同）"""
+    lm = _rows(lm)
+    close_distance = palm_base_length * finger_distance_threshold
+    if close_distance <= 0:
+        return False
+    fx = lm[8][0] - lm[12][0]
+    fy = lm[8][1] - lm[12][1]
+    if not fx * fx + fy * fy < close_distance * close_distance:
+        return False
+    if not _finger_bent_py(lm, 16, 14) or not _finger_bent_py(lm, 20, 18):
+        return False
+    if not _finger_extended_py(lm, 8, 6, 5, palm_base_sq, 0.6):
+        return False
+    if not _finger_extended_py(lm, 12, 10, 9, palm_base_sq, 0.6):
+        return False
+    if palm_base_sq <= 0:
+        return False
+    tx = lm[4][0] - palm_center_x
+    ty = lm[4][1] - palm_center_y
+    return tx * tx + ty * ty < palm_base_sq * 0.25
+
+
+def _finger_up_mask_py(lm, is_right: bool) -> np.ndarray:
+    """finger_up_mask 的纯 Python 实现"""
+    lm = _rows(lm)
+    if is_right:
+        thumb = lm[4][0] > lm[3][0]
+    else:
+        thumb = lm[4][0] < lm[3][0]
+    mask = [thumb] + [lm[tip][1] < lm[tip - 2][1] for tip in (8, 12, 16, 20)]
+    return np.array(mask, dtype=np.uint8)
+
+
+if NUMBA_AVAILABLE:
+    finger_extended = _finger_extended_jit
+    finger_bent = _finger_bent_jit
+    hand_upward = _hand_upward_jit
+    two_finger_pose = _two_finger_pose_jit
+    finger_up_mask = _finger_up_mask_jit
+else:
+    finger_extended = _finger_extended_py
+    finger_bent = _finger_bent_py
+    hand_upward = _hand_upward_py
+    two_finger_pose = _two_finger_pose_py
+    finger_up_mask = _finger_up_mask_py
+
+
+def kernel_input(arr: np.ndarray):
+    """
+    把关键点数组转换为内核的最佳输入形式，每帧每只手只需转换一次
+    Args:
+        arr: 关键点数组 (21, 3) int32
+    Returns:
+        有 numba 时为原数组，否则为嵌套列表
+    """
+    return arr if NUMBA_AVAILABLE else arr.tolist()
+
+
+def _warm_up():
+    """导入时预编译（或从磁盘缓存加载）各内核，避免首帧出现编译卡顿"""
+    lm = np.zeros((21, 3), dtype=np.int32)
+    _fingertip_variance_jit(np.zeros((5, 2), dtype=np.int32))
+    _finger_extended_jit(lm, 8, 6, 5, 0, 0.6)
+    _finger_bent_jit(lm, 16, 14)
+    _hand_upward_jit(lm)
+    _two_finger_pose_jit(lm, 0, 0, 0, 0.0, 0.25)
+    _finger_up_mask_jit(lm, True)
+    bbox_iou(0, 0, 1, 1, 0, 0, 1, 1)
+
+
+if NUMBA_AVAILABLE:
+    _warm_up()
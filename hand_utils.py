@@ -3,10 +3,166 @@
 """
 
 import math
-from typing import List, Tuple, Optional
+import threading
+from typing import List, Optional, Sequence, Tuple
 
 import numpy as np
 
+from hand_kernels import (
+    bbox_iou, fingertip_variance, finger_extended, finger_bent, hand_upward, kernel_input, two_finger_pose,
+)
+
+# 热路径上使用的数学函数预先绑定为模块级名称，省去逐次的属性查找
+_sqrt = math.sqrt
+_hypot = math.hypot
+_atan2 = math.atan2
+_degrees = math.degrees
+
+# 关键点索引数组（与 HandUtils.FINGERTIPS / HandUtils.PALM_POINTS 一致），用于数组花式索引
+FINGERTIPS_ARR = np.array([4, 8, 12, 16, 20], dtype=np.intp)
+PALM_POINTS_ARR = np.array([0, 1, 5, 9, 13, 17], dtype=np.intp)
+
+
+def _round_div6(total: int) -> int:
+    """整数除以 6 并四舍五入，负数与正数对称（.5 时取远离零的方向）"""
+    if total >= 0:
+        return (total + 3) // 6
+    return -((3 - total) // 6)
+
+
+class HandFrame:
+    """
+    单帧手部数据缓存
+    同一帧内各检测器会对同一组关键点反复计算手掌中心、手掌基准长度和指尖距离，
+    HandFrame 对每帧每只手只计算一次，HandUtils 的方法通过 HandFrame.of 复用这些结果
+    缓存按线程隔离，并由帧的处理方（GestureManager.begin_frame）在每帧开始时清空，
+    因此不会跨线程共享，也不会把上一帧（或被原地修改过的关键点）的结果带入新的一帧
+    """
+    
+    __slots__ = ('landmarks', 'arr', 'kernel_lm', 'palm_base_sq', 'palm_base_length', 'palm_center', '_fingertip_distances')
+    
+    _CACHE_SIZE = 4                # 未调用 reset 时缓存的帧数上限，多手场景下互不覆盖
+    _local = threading.local()     # 各线程自己的帧缓存列表，按关键点对象的身份复用
+    
+    def __init__(self, landmarks: np.ndarray):
+        """
+        预计算手部不变量
+        Args:
+            landmarks: 手部关键点数组 (21, 3)
+        """
+        self.landmarks = landmarks
+        self.arr = np.asarray(landmarks, dtype=np.int32)  # 已是 int32 数组时不复制
+        self.kernel_lm = kernel_input(self.arr)  # 传给判断内核的关键点（无 numba 时为列表）
+        
+        # 手掌基准长度（手腕到中指根部的距离）及其平方
+        dx, dy = (self.arr[0, :2] - self.arr[9, :2]).tolist()
+        self.palm_base_sq = dx * dx + dy * dy
+        self.palm_base_length = _sqrt(self.palm_base_sq)
+        
+        # 手掌中心（手腕和五个手指根部的平均位置），全程整数运算并四舍五入
+        sum_x, sum_y = np.add.reduce(self.arr[PALM_POINTS_ARR, :2], axis=0).tolist()
+        self.palm_center = (_round_div6(sum_x), _round_div6(sum_y))
+        
+        self._fingertip_distances = None  # 首次使用时计算
+    
+    @classmethod
+    def _recent(cls) -> List['HandFrame']:
+        """获取当前线程的帧缓存列表"""
+        local = cls._local
+        try:
+            return local.frames
+        except AttributeError:
+            local.frames = []
+            return local.frames
+    
+    @classmethod
+    def reset(cls):
+        """清空当前线程的帧缓存，每帧开始时调用"""
+        cls._recent().clear()
+    
+    @classmethod
+    def _remember(cls, frame: 'HandFrame'):
+        """将帧加入缓存，超出容量时淘汰最旧的帧"""
+        recent = cls._recent()
+        recent.append(frame)
+        if len(recent) > cls._CACHE_SIZE:
+            del recent[0]
+    
+    @classmethod
+    def of(cls, landmarks: np.ndarray) -> 'HandFrame':
+        """
+        获取关键点对应的帧缓存，同一关键点对象只构建一次
+        Args:
+            landmarks: 手部关键点数组
+        Returns:
+            HandFrame 实例
+        """
+        for frame in reversed(cls._recent()):
+            if frame.landmarks is landmarks:
+                return frame
+        frame = cls(landmarks)
+        cls._remember(frame)
+        return frame
+    
+    @classmethod
+    def prime(cls, landmarks_list: List[np.ndarray]):
+        """
+        用一次批量计算为本帧所有手构建缓存
+        Args:
+            landmarks_list: 本帧各手的关键点数组列表
+        """
+        if not landmarks_list:
+            return
+        features = HandUtils.batch_features(np.stack(landmarks_list))
+        for i, landmarks in enumerate(landmarks_list):
+            frame = cls.__new__(cls)
+            frame.landmarks = landmarks
+            frame.arr = np.asarray(landmarks, dtype=np.int32)
+            frame.kernel_lm = kernel_input(frame.arr)
+            frame.palm_base_sq = int(features['palm_base_sq'][i])
+            frame.palm_base_length = _sqrt(frame.palm_base_sq)
+            frame.palm_center = tuple(features['palm_center'][i].tolist())
+            frame._fingertip_distances = features['fingertip_distances'][i]
+            cls._remember(frame)
+    
+    @property
+    def fingertip_distances(self) -> np.ndarray:
+        """五个手指尖到手掌中心的距离 (5,)，每帧只计算一次"""
+        if self._fingertip_distances is None:
+            fingertips = self.arr[FINGERTIPS_ARR, :2].astype(np.float32)
+            center = np.asarray(self.palm_center, dtype=np.float32)
+            self._fingertip_distances = np.linalg.norm(fingertips - center, axis=1)
+        return self._fingertip_distances
+    
+    @property
+    def is_upward(self) -> bool:
+        """五个指尖是否都在手腕上方"""
+        return hand_upward(self.kernel_lm)
+    
+    @property
+    def is_open(self) -> bool:
+        """五个指尖是否都远离掌心（超过 0.5 倍手掌基准长度）"""
+        palm_base_length = self.palm_base_length
+        if palm_base_length <= 0:
+            return False
+        return bool((self.fingertip_distances > palm_base_length * 0.5).all())
+    
+    def is_finger_extended(self, finger_tip_index: int, finger_pip_index: int,
+                           finger_mcp_index: int, distance_threshold_percent: float = 0.6) -> bool:
+        """
+        判断手指是否伸直且朝上（使用距离平方比较，避免开方）
+        Args:
+            finger_tip_index: 指尖索引
+            finger_pip_index: PIP 关节索引
+            finger_mcp_index: MCP 关节索引
+            distance_threshold_percent: 距离阈值百分比
+        Returns:
+            手指是否伸直且朝上
+        """
+        # 指尖到手腕的距离 > 阈值 * 手掌基准长度（两边同时平方），且指尖Y坐标小于PIP、PIP小于MCP
+        return finger_extended(self.kernel_lm, finger_tip_index, finger_pip_index, finger_mcp_index,
+                               self.palm_base_sq, distance_threshold_percent)
+
 
 class HandUtils:
     """手部工具类"""
@@ -16,87 +172,151 @@ class HandUtils:
     PALM_POINTS = [0, 1, 5, 9, 13, 17]  # 手腕、拇指根、食指根、中指根、无名指根、小指根
     
     @staticmethod
-    def calculate_palm_center(landmarks: List[List[int]]) -> Tuple[int, int]:
+    def from_landmarks(landmarks) -> np.ndarray:
+        """
+        将关键点转换为连续的二维坐标数组
+        Args:
+            landmarks: 手部关键点（数组或嵌套列表）
+        Returns:
+            关键点坐标数组 (21, 2)，float32
+        """
+        return np.ascontiguousarray(np.asarray(landmarks)[:, :2], dtype=np.float32)
+    
+    @staticmethod
+    def batch_features(all_landmarks: np.ndarray) -> dict:
+        """
+        批量计算多只手的手部特征
+        Args:
+            all_landmarks: 所有手的关键点数组 (H, 21, 3)
+        Returns:
+            特征字典：
+            'palm_center': 手掌中心 (H, 2) int
+            'palm_base_sq': 手掌基准长度平方 (H,)
+            'palm_base_length': 手掌基准长度 (H,)
+            'fingertip_distances': 指尖到手掌中心的距离 (H, 5) float32
+            'open': 手是否张开 (H,) bool
+            'closed': 手是否握拳 (H,) bool
+        """
+        lm = np.asarray(all_landmarks, dtype=np.int32)[:, :, :2]
+        
+        base = (lm[:, 0] - lm[:, 9]).astype(np.int64)
+        palm_base_sq = (base * base).sum(axis=1)
+        palm_base_length = np.sqrt(palm_base_sq)
+        
+        palm_sums = np.add.reduce(lm[:, PALM_POINTS_ARR].astype(np.int64), axis=1)
+        palm_center = np.sign(palm_sums) * ((np.abs(palm_sums) + 3) // 6)  # 与 _round_div6 相同的对称四舍五入
+        fingertip_distances = np.linalg.norm(
+            lm[:, FINGERTIPS_ARR].astype(np.float32) - palm_center[:, None].astype(np.float32), axis=2
+        )
+        
+        valid = palm_base_length > 0
+        return {
+            'palm_center': palm_center,
+            'palm_base_sq': palm_base_sq,
+            'palm_base_length': palm_base_length,
+            'fingertip_distances': fingertip_distances,
+            'open': valid & (fingertip_distances > palm_base_length[:, None] * 0.5).all(axis=1),
+            'closed': valid & (fingertip_distances < palm_base_length[:, None] * 0.5).all(axis=1),
+        }
+    
+    @staticmethod
+    def calculate_palm_center(landmarks: np.ndarray) -> Tuple[int, int]:
         """
         计算手掌中心
         Args:
-            landmarks: 手部关键点列表
+            landmarks: 手部关键点数组
         Returns:
             手掌中心坐标 (x, y)
         """
-        # 手腕和五个手指根部
-        palm_points = [landmarks[i] for i in HandUtils.PALM_POINTS]
-        
-        center_x = sum(point[0] for point in palm_points) / len(palm_points)
-        center_y = sum(point[1] for point in palm_points) / len(palm_points)
-        
-        return (int(center_x), int(center_y))
+        return HandFrame.of(landmarks).palm_center
     
     @staticmethod
-    def calculate_distance(p1: List[int], p2: List[int]) -> float:
+    def calculate_distance(p1: Sequence[int], p2: Sequence[int]) -> float:
         """
         计算两点之间的距离
+        Args:
+            p1: 第一个点坐标（列表、元组或数组均可）
+            p2: 第二个点坐标（列表、元组或数组均可）
+        Returns:
+            距离值
+        """
+        return _hypot(p1[0] - p2[0], p1[1] - p2[1])
+    
+    @staticmethod
+    def calculate_distance_sq(p1: Sequence[int], p2: Sequence[int]) -> float:
+        """
+        计算两点之间距离的平方（只做大小比较时使用，避免开方）
         Args:
             p1: 第一个点坐标
             p2: 第二个点坐标
         Returns:
-            距离值
+            距离平方
+        """
+        dx = p1[0] - p2[0]
+        dy = p1[1] - p2[1]
+        return dx * dx + dy * dy
+    
+    @staticmethod
+    def calculate_bbox_iou(bbox1: Sequence[int], bbox2: Sequence[int]) -> float:
+        """
+        计算两个包围盒的交并比（IoU）
+        Args:
+            bbox1: 第一个包围盒 (x, y, w, h)
+            bbox2: 第二个包围盒 (x, y, w, h)
+        Returns:
+            IoU 值，范围 0-1
         """
-        return math.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)
+        return bbox_iou(*bbox1, *bbox2)
     
     @staticmethod
-    def calculate_palm_base_length(landmarks: List[List[int]]) -> float:
+    def calculate_palm_base_length(landmarks: np.ndarray) -> float:
         """
         计算手掌基准长度（手腕到中指根部的距离）
         Args:
-            landmarks: 手部关键点列表
+            landmarks: 手部关键点数组
         Returns:
             手掌基准长度
         """
-        wrist = landmarks[0]
-        middle_mcp = landmarks[9]  # 中指根部
-        return HandUtils.calculate_distance(wrist, middle_mcp)
+        return HandFrame.of(landmarks).palm_base_length
     
     @staticmethod
-    def calculate_fingertip_distances(landmarks: List[List[int]], palm_center: Tuple[int, int]) -> List[float]:
+    def calculate_fingertip_distances(landmarks: np.ndarray, palm_center: Tuple[int, int]) -> np.ndarray:
         """
         计算所有手指尖到手掌中心的距离
         Args:
-            landmarks: 手部关键点列表
+            landmarks: 手部关键点数组
             palm_center: 手掌中心坐标
         Returns:
-            五个手指尖到手掌中心的距离列表
+            五个手指尖到手掌中心的距离数组 (5,)
         """
-        fingertips = [landmarks[i] for i in HandUtils.FINGERTIPS]
-        return [HandUtils.calculate_distance(tip, list(palm_center)) for tip in fingertips]
+        frame = HandFrame.of(landmarks)
+        if tuple(palm_center) == frame.palm_center:
+            return frame.fingertip_distances
+        
+        fingertips = frame.arr[FINGERTIPS_ARR, :2].astype(np.float32)
+        center = np.asarray(palm_center, dtype=np.float32)
+        return np.linalg.norm(fingertips - center, axis=1)
     
     @staticmethod
-    def calculate_fingertip_variance(landmarks: List[List[int]]) -> float:
+    def calculate_fingertip_variance(landmarks: np.ndarray) -> float:
         """
         计算手指尖之间距离的方差（用于检测手掌张开程度）
         Args:
-            landmarks: 手部关键点列表
+            landmarks: 手部关键点数组
         Returns:
             手指尖距离方差
         """
-        fingertips = [landmarks[i] for i in HandUtils.FINGERTIPS]
-        
-        distances = []
-        for i in range(len(fingertips)):
-            for j in range(i + 1, len(fingertips)):
-                dist = HandUtils.calculate_distance(fingertips[i], fingertips[j])
-                distances.append(dist)
-        
-        return float(np.var(distances)) if len(distances) > 1 else 0.0
+        fingertips = np.ascontiguousarray(HandFrame.of(landmarks).arr[FINGERTIPS_ARR, :2])
+        return float(fingertip_variance(fingertips))
     
     @staticmethod
-    def is_finger_extended_and_upward(landmarks: List[List[int]], finger_tip_index: int, 
+    def is_finger_extended_and_upward(landmarks: np.ndarray, finger_tip_index: int, 
                                     finger_pip_index: int, finger_mcp_index: int, 
                                     distance_threshold_percent: float = 0.6) -> bool:
         """
         判断手指是否伸直（基于距离百分比）且朝上
         Args:
-            landmarks: 手部关键点列表
+            landmarks: 手部关键点数组
             finger_tip_index: 指尖索引
             finger_pip_index: PIP 关节索引
             finger_mcp_index: MCP 关节索引
@@ -104,54 +324,33 @@ class HandUtils:
         Returns:
             手指是否伸直
         """
-        wrist = landmarks[0]
-        tip = landmarks[finger_tip_index]
-        pip = landmarks[finger_pip_index]
-        mcp = landmarks[finger_mcp_index]
-        
-        # 计算手掌基准长度
-        palm_base_length = HandUtils.calculate_palm_base_length(landmarks)
-        
-        # 检查手指是否伸直（指尖到手腕的距离 > 阈值 * 手掌基准长度）
-        tip_to_wrist_dist = HandUtils.calculate_distance(tip, wrist)
-        extended = tip_to_wrist_dist > palm_base_length * distance_threshold_percent
-        upward = tip[1] < pip[1] < mcp[1]  # 指尖Y坐标小于PIP且PIP小于MCP
-        
-        return extended and upward
+        return HandFrame.of(landmarks).is_finger_extended(
+            finger_tip_index, finger_pip_index, finger_mcp_index, distance_threshold_percent
+        )
     
     @staticmethod
-    def is_finger_bent(landmarks: List[List[int]], finger_tip_index: int, 
+    def is_finger_bent(landmarks: np.ndarray, finger_tip_index: int, 
                       finger_pip_index: int) -> bool:
         """
         判断手指是否弯曲 - 支持任意手部朝向
         使用距离比较法，比单纯的坐标比较更准确
         Args:
-            landmarks: 手部关键点列表
+            landmarks: 手部关键点数组
             finger_tip_index: 指尖索引
             finger_pip_index: PIP关节索引
             finger_mcp_index: MCP关节索引（可选，提供时判断更准确）
         Returns:
             手指是否弯曲
         """
-        tip = landmarks[finger_tip_index]
-        pip = landmarks[finger_pip_index]
-        
-        # 使用手腕作为参考点
-        wrist = landmarks[0]
-        
-        # 计算指尖到手腕和PIP到手腕的距离
-        tip_to_wrist_dist = HandUtils.calculate_distance(tip, wrist)
-        pip_to_wrist_dist = HandUtils.calculate_distance(pip, wrist)
-        
-        # 如果指尖到手腕的距离小于PIP到手腕的距离，说明手指弯曲
-        return tip_to_wrist_dist < pip_to_wrist_dist * 0.9
+        # 以手腕为参考点，指尖到手腕的距离小于PIP到手腕的距离，说明手指弯曲
+        return finger_bent(HandFrame.of(landmarks).kernel_lm, finger_tip_index, finger_pip_index)
     
     @staticmethod
-    def calculate_thumb_angle(landmarks: List[List[int]]) -> float:
+    def calculate_thumb_angle(landmarks: np.ndarray) -> float:
         """
         计算大拇指与垂直方向的夹角（双向）
         Args:
-            landmarks: 手部关键点列表
+            landmarks: 手部关键点数组
         Returns:
             大拇指角度（度），范围 0-90 度，不论向上还是向下
         """
@@ -159,32 +358,22 @@ class HandUtils:
         thumb_mcp = landmarks[2]
         
         # 计算大拇指向量（从MCP到TIP）
-        thumb_vector = [thumb_tip[0] - thumb_mcp[0], thumb_tip[1] - thumb_mcp[1]]
+        dx = float(thumb_tip[0] - thumb_mcp[0])
+        dy = float(thumb_tip[1] - thumb_mcp[1])
         
-        # 计算向量长度
-        thumb_length = math.sqrt(thumb_vector[0]**2 + thumb_vector[1]**2)
-        
-        if thumb_length == 0:
+        if dx == 0 and dy == 0:
             return 90.0
         
-        # 计算与垂直方向的夹角（使用Y分量的绝对值）
-        # abs(cos(θ)) = |y_component| / length
-        cos_angle = abs(thumb_vector[1]) / thumb_length
-        cos_angle = min(1.0, cos_angle)  # 限制在[0, 1]范围内
-        
-        # 计算角度（这给出的是与垂直方向的夹角）
-        angle_rad = math.acos(cos_angle)
-        angle_deg = math.degrees(angle_rad)
-        
-        return angle_deg
+        # 与垂直方向的夹角：atan2(|x分量|, |y分量|)，等价于 acos(|y|/长度)，无需开方和截断
+        return _degrees(_atan2(abs(dx), abs(dy)))
     
     @staticmethod
-    def check_fingers_spread(landmarks: List[List[int]], finger1_index: int, 
+    def check_fingers_spread(landmarks: np.ndarray, finger1_index: int, 
                            finger2_index: int, reference_length_ratio: float = 0.3) -> bool:
         """
         检查两个手指是否分开（如V字形状）
         Args:
-            landmarks: 手部关键点列表
+            landmarks: 手部关键点数组
             finger1_index: 第一个手指尖索引
             finger2_index: 第二个手指尖索引
             reference_length_ratio: 参考长度比值
@@ -194,81 +383,70 @@ class HandUtils:
         finger1_tip = landmarks[finger1_index]
         finger2_tip = landmarks[finger2_index]
         
-        # 计算手指间距离
-        fingers_distance = HandUtils.calculate_distance(finger1_tip, finger2_tip)
+        # 计算手指间距离的平方
+        fingers_distance_sq = HandUtils.calculate_distance_sq(finger1_tip, finger2_tip)
         
-        # 计算手掌基准长度作为参考
-        palm_base_length = HandUtils.calculate_palm_base_length(landmarks)
+        # 计算手掌基准长度的平方作为参考
+        palm_base_sq = HandFrame.of(landmarks).palm_base_sq
         
-        # 如果手指间距离大于手掌基准长度的指定比例，认为是张开的
-        return fingers_distance > palm_base_length * reference_length_ratio
+        # 如果手指间距离大于手掌基准长度的指定比例，认为是张开的（两边平方）
+        return fingers_distance_sq > palm_base_sq * (reference_length_ratio * reference_length_ratio)
     
     @staticmethod
-    def is_thumb_close_to_palm(landmarks: List[List[int]], distance_threshold_percent: float = 0.4) -> bool:
+    def is_thumb_close_to_palm(landmarks: np.ndarray, distance_threshold_percent: float = 0.4) -> bool:
         """
         判断拇指是否靠近掌心
         Args:
-            landmarks: 手部关键点列表
+            landmarks: 手部关键点数组
             distance_threshold_percent: 距离阈值百分比（相对于手掌基准长度）
         Returns:
             拇指是否靠近掌心
         """
         thumb_tip = landmarks[4]
-        palm_center = HandUtils.calculate_palm_center(landmarks)
-        palm_base_length = HandUtils.calculate_palm_base_length(landmarks)
+        frame = HandFrame.of(landmarks)
         
-        # 计算拇指尖到掌心的距离
-        thumb_to_palm_distance = HandUtils.calculate_distance(thumb_tip, list(palm_center))
+        # 手掌基准长度为 0 时距离比例按 1.0 处理
+        if frame.palm_base_sq <= 0:
+            return 1.0 < distance_threshold_percent
         
-        # 计算距离比例
-        distance_ratio = thumb_to_palm_distance / palm_base_length if palm_base_length > 0 else 1.0
-        
-        # 如果距离小于阈值，认为拇指靠近掌心
-        return distance_ratio < distance_threshold_percent
+        # 拇指尖到掌心的距离 < 阈值 * 手掌基准长度，两边平方比较
+        thumb_to_palm_sq = HandUtils.calculate_distance_sq(thumb_tip, frame.palm_center)
+        return thumb_to_palm_sq < frame.palm_base_sq * (distance_threshold_percent * distance_threshold_percent)
 
     @staticmethod
-    def is_hand_upward(landmarks: List[List[int]]) -> bool:
+    def is_hand_upward(landmarks: np.ndarray) -> bool:
         """
         检查手是否向上
         Args:
-            landmarks: 手部关键点列表
+            landmarks: 手部关键点数组
         Returns:
             手是否向上
         """
-        wrist = landmarks[0]
-        
         # 检查手指尖的y坐标是否都小于手腕的y坐标
-        fingertips = [landmarks[i] for i in HandUtils.FINGERTIPS]
-        upward_fingers = sum(1 for tip in fingertips if tip[1] < wrist[1])
-        
-        return upward_fingers == 5
+        return hand_upward(HandFrame.of(landmarks).kernel_lm)
     
     @staticmethod
-    def detect_palm_back_orientation(landmarks: List[List[int]], hand_type: Optional[str] = None) -> str:
+    def detect_palm_back_orientation(landmarks: np.ndarray, hand_type: Optional[str] = None) -> str:
         """
         检测手心还是手背朝向摄像头
         基于手指从左到右的排列顺序和左右手类型来判断
         Args:
-            landmarks: 手部关键点列表
+            landmarks: 手部关键点数组
             hand_type: 手的类型 ("Left" 或 "Right")，如果为None则自动检测
         Returns:
             "palm": 手心朝向摄像头
             "back": 手背朝向摄像头  
             "uncertain": 不确定
         """
-        # 首先检查手是否向上且张开
-        if not HandUtils.is_hand_upward(landmarks) and not HandUtils.is_hand_open(landmarks):
+        # 首先检查手是否向上且张开，两者都满足时才能可靠判断
+        frame = HandFrame.of(landmarks)
+        if not (frame.is_upward and frame.is_open):
             return "uncertain"
         
-        # 获取手指尖的位置
-        thumb_tip = landmarks[4]    # 拇指尖
-        index_tip = landmarks[8]    # 食指尖
-        middle_tip = landmarks[12]  # 中指尖
-        ring_tip = landmarks[16]    # 无名指尖
-        pinky_tip = landmarks[20]   # 小指尖
-        
-        left_thumb_position = thumb_tip[0] < index_tip[0] < middle_tip[0] < ring_tip[0] < pinky_tip[0]
-        right_thumb_position = thumb_tip[0] > index_tip[0] > middle_tip[0] > ring_tip[0] > pinky_tip[0]
+        # 指尖（拇指到小指）X坐标的相邻差值，一次计算同时用于两个方向的判断
+        diffs = np.diff(frame.arr[FINGERTIPS_ARR, 0])
+        left_thumb_position = bool((diffs > 0).all())   # 拇指到小指从左到右排列
+        right_thumb_position = bool((diffs < 0).all())  # 拇指到小指从右到左排列
         
         # 根据手的类型和拇指位置判断朝向
         if hand_type == "Left":
@@ -280,69 +458,49 @@ class HandUtils:
                 return "uncertain"
         else:  # Right hand
             if right_thumb_position:
-                return "bacl"
+                return "back"
             elif left_thumb_position:
                 return "palm"
             else:
                 return "uncertain"
             
     @staticmethod
-    def is_hand_open(landmarks: List[List[int]], open_threshold: float = 0.5) -> bool:
+    def is_hand_open(landmarks: np.ndarray, open_threshold: float = 0.5) -> bool:
         """
         检查手是否张开
         Args:
-            landmarks: 手部关键点列表
+            landmarks: 手部关键点数组
             open_threshold: 张开阈值（相对于手掌基准长度的比例）
         Returns:
             手是否张开
         """
-        palm_center = HandUtils.calculate_palm_center(landmarks)
-        palm_base_length = HandUtils.calculate_palm_base_length(landmarks)
+        frame = HandFrame.of(landmarks)
+        palm_base_length = frame.palm_base_length
         
         if palm_base_length <= 0:
             return False
         
-        fingertip_distances = HandUtils.calculate_fingertip_distances(landmarks, palm_center)
-        
-        # 检查是否有足够多的手指远离掌心（张开状态）
-        open_fingers = sum(1 for dist in fingertip_distances if dist > palm_base_length * open_threshold)
+        fingertip_distances = frame.fingertip_distances
         
-        return open_fingers == 5
+        # 检查是否所有手指都远离掌心（张开状态）
+        return bool((fingertip_distances > palm_base_length * open_threshold).all())
     
     @staticmethod
-    def is_hand_closed(landmarks: List[List[int]], distances: List[float]) -> bool:
+    def is_hand_closed(landmarks: np.ndarray, distances: np.ndarray) -> bool:
         """判断手是否处于握拳状态"""
         # 计算手掌基准长度
-        palm_base_length = HandUtils.calculate_palm_base_length(landmarks)
+        palm_base_length = HandFrame.of(landmarks).palm_base_length
         
         if palm_base_length <= 0:
             return False
         
         # 检查所有手指尖到掌心的距离是否都很小
         max_allowed_distance = palm_base_length * 0.5  # 握拳时手指尖应该很接近掌心
-        close_fingers = sum(1 for dist in distances if dist < max_allowed_distance)
-        
-        return close_fingers == 5  # 所有5根手指都必须接近掌心
+        return bool((np.asarray(distances) < max_allowed_distance).all())  # 所有5根手指都必须接近掌心
     
     @staticmethod
-    def check_two_finger_pose(landmarks: List[List[int]], palm_base_length: float, finger_distance_threshold: float) -> bool:
+    def check_two_finger_pose(landmarks: np.ndarray, palm_base_length: float, finger_distance_threshold: float) -> bool:
         """检查是否为双指姿态（食指和中指并拢朝上，其他手指弯曲）"""
-        # 1. 检查食指和中指是否伸直且朝上
-        index_extended = HandUtils.is_finger_extended_and_upward(landmarks, 8, 6, 5, 0.6)
-        middle_extended = HandUtils.is_finger_extended_and_upward(landmarks, 12, 10, 9, 0.6)
-        
-        # 2. 检查无名指和小指是否弯曲
-        ring_bent = HandUtils.is_finger_bent(landmarks, 16, 14)
-        pinky_bent = HandUtils.is_finger_bent(landmarks, 20, 18)
-        
-        # 3. 检查拇指是否靠近掌心
-        thumb_close_to_palm = HandUtils.is_thumb_close_to_palm(landmarks, 0.5)
-        
-        # 4. 检查食指和中指是否并拢（距离很近）
-        index_tip = landmarks[8]
-        middle_tip = landmarks[12]
-        finger_distance = HandUtils.calculate_distance(index_tip, middle_tip)
-        fingers_close = finger_distance < palm_base_length * finger_distance_threshold
-
-        return (index_extended and middle_extended and ring_bent and
-                pinky_bent and thumb_close_to_palm and fingers_close)
\ No newline at end of file
+        frame = HandFrame.of(landmarks)
+        return two_finger_pose(frame.kernel_lm, frame.palm_base_sq, frame.palm_center[0], frame.palm_center[1],
+                               palm_base_length, finger_distance_threshold)
\ No newline at end of file
@@ -2,10 +2,83 @@
 日志配置模块
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import time
 from datetime import datetime
 
+
+class BatchedFileHandler(logging.FileHandler):
+    """批量刷盘的文件处理器
+    
+    标准 FileHandler 每条记录都会 flush 一次，产生一次 write 系统调用。
+    这里记录先写入文件对象的缓冲区，累计超过 flush_bytes 字节、距上次刷盘超过
+    flush_interval 秒，或遇到 ERROR 及以上级别的记录时才统一刷盘。
+    没有新记录到来时，由 FlushingQueueListener 在 flush_deadline 到期后刷盘。
+    """
+    
+    def __init__(self, filename, mode='a', encoding=None, flush_bytes: int = 4096,
+                 flush_interval: float = 0.1):
+        super().__init__(filename, mode, encoding)
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self._pending = 0
+        self._last_flush = time.monotonic()
+    
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg)
+            self._pending += len(msg)
+            if (self._pending >= self.flush_bytes
+                    or record.levelno >= logging.ERROR
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        super().flush()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+    
+    def flush_deadline(self):
+        """缓冲区中有未刷盘的数据时返回最晚的刷盘时刻（monotonic），否则返回 None"""
+        if not self._pending:
+            return None
+        return self._last_flush + self.flush_interval
+
+
+class FlushingQueueListener(logging.handlers.QueueListener):
+    """定时刷盘的队列监听器
+    
+    BatchedFileHandler 只在下一条记录到来时检查刷盘间隔，安静的进程中最后几条
+    记录会一直留在缓冲区里，进程崩溃或被杀死时随之丢失。这里在队列空闲时最多
+    等待到最早的刷盘时刻，超时仍无新记录则主动刷盘。
+    """
+    
+    def __init__(self, queue_, *handlers, respect_handler_level=False):
+        super().__init__(queue_, *handlers, respect_handler_level=respect_handler_level)
+        self._batched = [h for h in handlers if isinstance(h, BatchedFileHandler)]
+    
+    def dequeue(self, block):
+        while True:
+            deadlines = [d for d in (h.flush_deadline() for h in self._batched) if d is not None]
+            if not deadlines:
+                return self.queue.get(block)
+            try:
+                return self.queue.get(block, max(0.0, min(deadlines) - time.monotonic()))
+            except queue.Empty:
+                for handler in self._batched:
+                    if handler.flush_deadline() is not None:
+                        handler.flush()
+
+
 def setup_logger(name: str = "gesture_app", level: str = "INFO") -> logging.Logger:
     """设置日志记录器
     
@@ -34,7 +107,7 @@ def setup_logger(name: str = "gesture_app", level: str = "INFO") -> logging.Logg
     # 创建文件处理器
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(log_dir, f"gesture_app_{timestamp}.log")
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler = BatchedFileHandler(log_file, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
     
     # 创建控制台处理器
@@ -48,8 +121,16 @@ def setup_logger(name: str = "gesture_app", level: str = "INFO") -> logging.Logg
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    # 添加处理器到日志记录器
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # 日志记录器只挂一个队列处理器，格式化和文件/控制台写入由后台监听线程完成，
+    # 调用方只做一次入队，不会被磁盘 I/O 阻塞
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = FlushingQueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    logger.queue_listener = listener
+    # 退出时停止监听线程，确保队列中剩余的日志全部写出
+    atexit.register(listener.stop)
     
     return logger
@@ -3,19 +3,33 @@
 """
 
 import cv2
+import numpy as np
 import time
+from collections import deque
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 import config
 from cvzone.HandTrackingModule import HandDetector
 from gestures.manager import GestureManager
 from connect.socket_client import initialize_client, disconnect_client
 from display import Display
+from hand_utils import HandUtils
 from camera_manager import CameraManager
 from logger_config import setup_logger
 
 # 设置日志
 logger = setup_logger(__name__)
 
+# cv2.pollKey 自 OpenCV 4.5.3 起提供，更早的版本退回 waitKey(1)
+_poll_key = getattr(cv2, 'pollKey', None) or (lambda: cv2.waitKey(1))
+
+
+@lru_cache(maxsize=64)
+def _default_gesture_message(hand_type: str, gesture_name: str) -> str:
+    """检测器未提供显示消息时的通用消息，左右手与手势名的组合有限，直接缓存"""
+    return f"{hand_type} Hand: {gesture_name}"
+
 
 class HandGestureApp:
     """手势检测应用主类"""
@@ -39,14 +53,45 @@ class HandGestureApp:
         # 运行状态
         self.running = True
         # 手势状态追踪
-        self.previous_hands = {}  # {hand_id: hand_data}
-        # FPS计算相关
-        self.fps_time = time.time()
-        self.fps_counter = 0
+        # 上一帧的手部记录，按检测序号存放 (landmarks, hand_type)，并用位掩码标记哪些序号有手
+        max_hands = config.HAND_DETECTION_CONFIG['max_hands']
+        self.hand_ids = tuple(f"hand_{i}" for i in range(max_hands))
+        self.previous_hands = [None] * max_hands
+        self.previous_hand_mask = 0
+        # 只检测一只手时使用专用的单手处理路径
+        self.process_hands = self._process_hands_single if max_hands == 1 else self._process_hands_multi
+        # 检测间隔相关：中间帧复用上次的检测结果
+        self.detection_interval = max(1, config.HAND_DETECTION_CONFIG.get('detection_interval', 1))
+        self.redetect_iou_threshold = config.HAND_DETECTION_CONFIG.get('redetect_iou_threshold', 0.7)
+        self.frames_since_detection = 0
+        self.last_hands = []
+        self.hands_stable = False  # 最近两次检测之间手的位置是否稳定
+        # 检测器输入缩放比例，绘制仍在原分辨率图像上进行
+        self.detector_input_scale = config.HAND_DETECTION_CONFIG.get('input_scale', 1.0)
+        # 翻转画面的目标缓冲区，首帧按画面尺寸分配，之后原地复用
+        self._flip_buf = None
+        # 上次检查窗口是否被关闭的时间
+        self._last_window_check = 0.0
+        # FPS计算相关：最近若干帧的单调时钟时间戳（纳秒），按滑动窗口计算帧率
+        self.frame_times = deque(maxlen=64)
+        self.fps_time = time.monotonic_ns()  # 上次刷新FPS显示的时间
         self.fps_display = 0.0
-        # FPS计算
-        self.prev_time = time.time()
-        self.fps = 0
+        # 运行期间不变的显示配置，缓存为属性以免每帧查字典
+        display_config = config.DISPLAY_CONFIG
+        self.flip_image = display_config['flip_image']
+        self.show_landmarks = display_config['show_landmarks']
+        self.show_palm_center = display_config['show_palm_center']
+        self.show_fps = display_config['show_fps']
+        self.show_camera_window = display_config['show_camera_window']
+        # 不显示窗口时画面会被直接丢弃，跳过所有绘制
+        self.draw_enabled = self.show_camera_window
+        self.window_name = display_config['window_name']
+        self.gesture_message_duration = display_config['gesture_message_duration']
+        self.palm_center_color = config.COLORS['palm_center']
+        self.trail_color = config.COLORS['fist_trail']
+        self.trail_center_color = config.COLORS['fist_center']
+        self.gesture_message_color = config.COLORS['gesture_message']
+        self.fps_text_color = config.COLORS['fps_text']
     
     def initialize(self) -> bool:
         """初始化应用组件
@@ -69,7 +114,10 @@ class HandGestureApp:
             self.detector = HandDetector(
                 maxHands=config.HAND_DETECTION_CONFIG['max_hands'],
                 detectionCon=config.HAND_DETECTION_CONFIG['detection_confidence'],
-                minTrackCon=config.HAND_DETECTION_CONFIG['min_tracking_confidence']
+                minTrackCon=config.HAND_DETECTION_CONFIG['min_tracking_confidence'],
+                liveStream=config.HAND_DETECTION_CONFIG.get('live_stream', False),
+                modelPath=config.HAND_DETECTION_CONFIG.get('model_path', 'cvzone/hand_landmarker.task'),
+                useOpenCL=config.HAND_DETECTION_CONFIG.get('use_opencl', False)
             )
             self.logger.info("手部检测器初始化完成")
             
@@ -91,97 +139,166 @@ class HandGestureApp:
             return False
     
     def update_fps(self):
-        """更新FPS计算"""
-        self.fps_counter += 1
-        current_time = time.time()
+        """更新FPS计算（每帧只应调用一次，由 process_frame 在绘制FPS时调用）"""
+        current_time = time.monotonic_ns()
+        frame_times = self.frame_times
+        frame_times.append(current_time)
         
-        # 每秒更新一次FPS显示
-        if current_time - self.fps_time >= 1.0:
-            self.fps_display = self.fps_counter / (current_time - self.fps_time)
-            self.fps_counter = 0
+        # 每秒用滑动窗口内的帧数和时间跨度刷新一次FPS显示
+        if current_time - self.fps_time >= 1_000_000_000:
+            span = current_time - frame_times[0]
+            if span > 0:
+                self.fps_display = (len(frame_times) - 1) * 1e9 / span
             self.fps_time = current_time
         
         return self.fps_display
     
+    def should_run_detection(self) -> bool:
+        """判断当前帧是否需要运行手部检测"""
+        if self.detection_interval <= 1 or not self.hands_stable:
+            return True
+        return self.frames_since_detection + 1 >= self.detection_interval
+    
+    def update_detection_state(self, hands):
+        """
+        记录本次检测结果，并根据与上次检测的包围盒IoU判断手是否稳定
+        Args:
+            hands: 本次检测到的手部列表
+        """
+        if self.detection_interval > 1:
+            previous = self.last_hands
+            self.hands_stable = bool(hands) and len(hands) == len(previous) and all(
+                HandUtils.calculate_bbox_iou(hand["bbox"], prev["bbox"]) >= self.redetect_iou_threshold
+                for hand, prev in zip(hands, previous)
+            )
+        self.last_hands = hands
+        self.frames_since_detection = 0
+    
+    def process_hand(self, img, hand, index: int) -> Optional[Tuple[int, int]]:
+        """
+        处理单只手：检测手势、绘制手部信息并更新手部记录
+        Returns:
+            手掌中心坐标（不绘制时为 None）
+        """
+        landmarks = hand["lmList"]
+        hand_type = hand["type"]
+        
+        # 使用手势管理器检测手势
+        detected_gestures = self.gesture_manager.detect_gestures(
+            landmarks, self.hand_ids[index], hand_type
+        )
+
+        if detected_gestures:
+            # 处理检测到的手势
+            for gesture in detected_gestures:
+                self.handle_gesture_result(gesture)
+        
+        # 更新手部记录
+        self.previous_hands[index] = (landmarks, hand_type)
+        
+        # 绘制手部信息
+        if not self.draw_enabled:
+            return None
+        return Display.draw_hand_info(img, hand, index, self.detector)
+    
+    def _process_hands_multi(self, img, hands: list) -> Tuple[int, List[Optional[Tuple[int, int]]]]:
+        """
+        处理本帧检测到的所有手
+        Returns:
+            (出现的手部序号位掩码, 各手的手掌中心列表)
+        """
+        # 清空上一帧的手部缓存，多手时一次性批量计算各手的手掌特征
+        self.gesture_manager.begin_frame([hand["lmList"] for hand in hands])
+        
+        hand_mask = 0
+        palm_centers = []
+        for i, hand in enumerate(hands):
+            hand_mask |= 1 << i
+            palm_centers.append(self.process_hand(img, hand, i))
+        return hand_mask, palm_centers
+    
+    def _process_hands_single(self, img, hands: list) -> Tuple[int, List[Optional[Tuple[int, int]]]]:
+        """max_hands 为 1 时的专用版本：最多只有一只手，省去循环和批量预计算"""
+        self.gesture_manager.begin_frame((hands[0]["lmList"],))
+        return 1, [self.process_hand(img, hands[0], 0)]
+    
     def process_frame(self, img):
         """处理单帧图像"""        
         # 左右翻转摄像头画面（如果配置启用）
-        if config.DISPLAY_CONFIG['flip_image']:
-            img = cv2.flip(img, 1)
+        if self.flip_image:
+            if self._flip_buf is None or self._flip_buf.shape != img.shape:
+                self._flip_buf = np.empty_like(img)
+            img = cv2.flip(img, 1, dst=self._flip_buf)
         
         # 检测手部
         if self.detector:
-            hands, img = self.detector.findHands(
-                img, 
-                draw=config.DISPLAY_CONFIG['show_landmarks'], 
-                flipType=config.DISPLAY_CONFIG['flip_image']
-            )
+            if self.should_run_detection():
+                # 检测器内部不绘制，关键点与其他叠加信息统一在后面绘制
+                hands, img = self.detector.findHands(
+                    img, 
+                    draw=False, 
+                    flipType=self.flip_image,
+                    scale=self.detector_input_scale
+                )
+                self.update_detection_state(hands)
+            else:
+                # 手的位置稳定时复用上次检测结果
+                hands = self.last_hands
+                self.frames_since_detection += 1
         
-            # 记录当前帧的手部ID
-            current_hand_ids = set()
+            # 记录当前帧出现的手部序号（第 i 位为 1 表示 hand_i 存在）
+            current_hand_mask = 0
         
             if hands and self.gesture_manager is not None:
-                for i, hand in enumerate(hands):
-                    hand_id = f"hand_{i}"
-                    current_hand_ids.add(hand_id)
-                    landmarks = hand["lmList"]
-                    hand_type = hand["type"]
-                    
-                    # 使用手势管理器检测手势
-                    detected_gestures = self.gesture_manager.detect_gestures(
-                        landmarks, hand_id, hand_type
-                    )
-
-                    if detected_gestures:
-                        # 处理检测到的手势
-                        for gesture in detected_gestures:
-                            self.handle_gesture_result(gesture)
-                    
-                    # 绘制手部信息
-                    Display.draw_hand_info(img, hand, i, self.detector)
-
-                    # 更新手部记录
-                    self.previous_hands[hand_id] = {
-                        'landmarks': landmarks,
-                        'hand_type': hand_type
-                    }
+                current_hand_mask, palm_centers = self.process_hands(img, hands)
+                
+                # 统一绘制本帧所有手的关键点和手掌中心
+                if self.draw_enabled:
+                    if self.show_landmarks:
+                        for hand in hands:
+                            Display.draw_landmarks(img, hand)
+                    if self.show_palm_center:
+                        Display.draw_palm_centers(img, palm_centers, self.palm_center_color)
         
             if self.gesture_manager:
-                # 检测丢失的手部
-                lost_hand_ids = set(self.previous_hands.keys()) - current_hand_ids
-                for lost_hand_id in lost_hand_ids:
-                    self.gesture_manager.on_hand_lost(lost_hand_id)
-                    del self.previous_hands[lost_hand_id]
-                
-                # 如果没有检测到任何手
-                if not hands:
-                    # 清空所有手部记录
-                    if self.previous_hands:
-                        self.gesture_manager.on_all_hands_lost()
-                        self.previous_hands.clear()
+                # 检测丢失的手部：上一帧有、本帧没有的序号
+                lost_mask = self.previous_hand_mask & ~current_hand_mask
+                if lost_mask and not current_hand_mask:
+                    # 所有手都丢失，一次性清空全部记录
+                    self.gesture_manager.on_all_hands_lost()
+                    self.previous_hands = [None] * len(self.hand_ids)
+                else:
+                    while lost_mask:
+                        i = (lost_mask & -lost_mask).bit_length() - 1
+                        self.gesture_manager.on_hand_lost(self.hand_ids[i])
+                        self.previous_hands[i] = None
+                        lost_mask &= lost_mask - 1
+                self.previous_hand_mask = current_hand_mask
             
                 # 绘制手势轨迹（在其他绘制之前）
-                for detector in self.gesture_manager.get_all_tracker_detectors():
-                    tracker = detector.get_trajectory_tracker()
-                    trail_data = tracker.get_trail_data_for_drawing()
-                    if trail_data and tracker.tracking_config.get('enable_tracking', True):
+                if self.draw_enabled:
+                    for detector in self.gesture_manager.get_all_tracker_detectors():
+                        tracker = detector.get_trajectory_tracker()
+                        trail_data = tracker.get_trail_data_for_drawing()
+                        if trail_data and tracker.tracking_config.get('enable_tracking', True):
                             Display.draw_gesture_trails(
-                            img, 
-                            trail_data['trail_points'], 
-                            trail_data['tracking_active'],
-                            config.COLORS['fist_trail'],
-                            config.COLORS['fist_center'],
-                            trail_data['trail_thickness']
-                        )
+                                img, 
+                                trail_data['trail_points'], 
+                                trail_data['tracking_active'],
+                                self.trail_color,
+                                self.trail_center_color,
+                                trail_data['trail_thickness']
+                            )
         
         # 绘制手势消息
         if self.gesture_timer > 0:
-            Display.draw_gesture_message(img, self.gesture_message, config.COLORS['gesture_message'])
+            if self.draw_enabled:
+                Display.draw_gesture_message(img, self.gesture_message, self.gesture_message_color)
             self.gesture_timer -= 1
         
         # 绘制FPS（如果配置启用）
-        if config.DISPLAY_CONFIG['show_fps']:
-            Display.draw_fps(img, self.update_fps(), config.COLORS['fps_text'])
+        if self.draw_enabled and self.show_fps:
+            Display.draw_fps(img, self.update_fps(), self.fps_text_color)
         
         return img
     
@@ -190,22 +307,32 @@ class HandGestureApp:
         gesture_name = gesture_result['gesture']
         hand_type = gesture_result['hand_type']
         
-        # 使用检测器提供的显示消息
-        self.gesture_message = gesture_result.get('display_message', f"{hand_type} Hand: {gesture_name}")
-        self.gesture_timer = config.DISPLAY_CONFIG['gesture_message_duration']
+        # 使用检测器提供的显示消息，缺省时才回退到通用格式（避免每次都构造缺省字符串）
+        message = gesture_result.get('display_message')
+        if message is None:
+            message = _default_gesture_message(hand_type, gesture_name)
+        self.gesture_message = message
+        self.gesture_timer = self.gesture_message_duration
     
     def handle_window_events(self):
         """处理窗口事件"""
-        key = cv2.waitKey(1) & 0xFF
+        # pollKey 只处理窗口事件，不像 waitKey(1) 那样每帧额外休眠
+        key = _poll_key() & 0xFF
         
         # 按 'q' 退出
         if key == ord('q'):
             self.running = False
             return
         
+        # 窗口关闭检查开销较大，限制为每秒一次
+        now = time.monotonic()
+        if now - self._last_window_check < 1.0:
+            return
+        self._last_window_check = now
+        
         # 检查窗口是否被关闭
         try:
-            if cv2.getWindowProperty(config.DISPLAY_CONFIG['window_name'], cv2.WND_PROP_VISIBLE) < 1:
+            if cv2.getWindowProperty(self.window_name, cv2.WND_PROP_VISIBLE) < 1:
                 self.running = False
         except cv2.error:
             self.running = False
@@ -219,8 +346,8 @@ class HandGestureApp:
         
         try:
             while self.running:
-                # 读取摄像头帧
-                success, img = self.camera_manager.read_frame()
+                # 读取最新的摄像头帧（跳过积压的旧帧）
+                success, img = self.camera_manager.read_latest()
                 
                 if not success or img is None:
                     if config.USE_IP_CAMERA:
@@ -232,12 +359,10 @@ class HandGestureApp:
                 # 处理图像
                 processed_img = self.process_frame(img)
                 
-                # 显示图像（如果配置启用）
-                if config.DISPLAY_CONFIG['show_camera_window']:
-                    cv2.imshow(config.DISPLAY_CONFIG['window_name'], processed_img)
-                
-                # 处理窗口事件
-                self.handle_window_events()
+                # 显示图像并处理窗口事件（如果配置启用）
+                if self.show_camera_window:
+                    cv2.imshow(self.window_name, processed_img)
+                    self.handle_window_events()
                 
                 if not self.running:
                     break
@@ -259,7 +384,7 @@ class HandGestureApp:
             disconnect_client()
         
         # 只有在显示窗口时才需要销毁窗口
-        if config.DISPLAY_CONFIG['show_camera_window']:
+        if self.show_camera_window:
             cv2.destroyAllWindows()
         
         self.logger.info("应用已关闭")